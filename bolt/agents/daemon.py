@@ -7,60 +7,144 @@ Continuously runs experiments from the queue
 import os
 import sys
 import time
+import atexit
 import json
 import random
+import threading
 from datetime import datetime
 
+try:
+    import watchfiles
+except ImportError:
+    watchfiles = None
+
+# Seconds between queue sweeps when no experiment files change
+HOUSEKEEPING_INTERVAL = 60
+
 # In a real implementation, this would import the experiment runner
 # from ..run import BoltExperiment
 
 class MardukDaemon:
-    def __init__(self, experiment_dir, memory_dir):
+    def __init__(self, experiment_dir, memory_dir, pid_file="bolt/daemon.pid",
+                 force_polling=False):
         self.experiment_dir = experiment_dir
         self.memory_dir = memory_dir
+        self.pid_file = pid_file
+        self.force_polling = force_polling
         self.running = False
+        self._stop = threading.Event()
+        self._pid_cleanup_registered = False
         
     def start(self):
         """Start the daemon loop"""
         self.running = True
+        self._stop.clear()
         print(f"Starting Marduk Daemon")
         print(f"Monitoring experiment directory: {self.experiment_dir}")
         print(f"Memory directory: {self.memory_dir}")
         
+        self._write_pid_file()
+        
         try:
             self._main_loop()
         except KeyboardInterrupt:
             print("\nShutting down Marduk Daemon...")
+            self.stop()
         finally:
             self.running = False
+    
+    def stop(self):
+        """Stop the daemon loop, waking it immediately if it is waiting"""
+        self.running = False
+        self._stop.set()
             
+    def _write_pid_file(self):
+        """Record our PID so health checks can find us without a process scan"""
+        pid_dir = os.path.dirname(self.pid_file)
+        if pid_dir:
+            os.makedirs(pid_dir, exist_ok=True)
+        
+        with open(self.pid_file, 'w') as f:
+            f.write(str(os.getpid()))
+        
+        if not self._pid_cleanup_registered:
+            atexit.register(self._remove_pid_file)
+            self._pid_cleanup_registered = True
+    
+    def _remove_pid_file(self):
+        """Remove the PID file on exit"""
+        try:
+            os.remove(self.pid_file)
+        except FileNotFoundError:
+            pass
+    
     def _main_loop(self):
         """Main daemon execution loop"""
+        if watchfiles is not None and os.path.isdir(self.experiment_dir):
+            self._watch_loop()
+        else:
+            self._poll_loop()
+    
+    def _watch_loop(self):
+        """Dispatch experiments as files are added to the experiment directory"""
+        # Block in the kernel until experiment files change instead of
+        # waking up on a fixed interval. force_polling is needed for
+        # NFS-backed directories where inotify events are not delivered.
+        # The watcher ends once stopped, so each start needs a new one.
+        watcher = watchfiles.watch(
+            self.experiment_dir,
+            watch_filter=self._is_new_experiment,
+            stop_event=self._stop,
+            rust_timeout=HOUSEKEEPING_INTERVAL * 1000,
+            yield_on_timeout=True,
+            force_polling=self.force_polling
+        )
+        for changes in watcher:
+            if not self.running:
+                break
+            
+            # An empty change set means the housekeeping interval elapsed
+            if not changes:
+                print("No new experiment files. Running housekeeping sweep...")
+            
+            self._check_queue()
+    
+    def _poll_loop(self):
+        """Fallback loop for when filesystem watching is unavailable"""
         while self.running:
-            try:
-                # Get next experiment from queue
-                experiment = self._get_next_experiment()
-                
-                if experiment:
-                    print(f"\n{'='*50}")
-                    print(f"EXECUTING EXPERIMENT: {experiment}")
-                    print(f"{'='*50}\n")
-                    
-                    # Simulate running the experiment
-                    success = self._simulate_experiment(experiment)
-                    
-                    if success:
-                        self._log_success(experiment)
-                    else:
-                        self._log_failure(experiment, "Simulated failure")
-                else:
-                    print("No experiments in queue. Waiting...")
+            self._check_queue()
             
-            except Exception as e:
-                print(f"Error in daemon loop: {e}")
+            # Wait before checking again, returning early on stop()
+            if self._stop.wait(10):
+                break
+    
+    def _is_new_experiment(self, change, path):
+        """Only wake up for experiment files added to the directory"""
+        return change == watchfiles.Change.added and path.endswith('.toml')
+    
+    def _check_queue(self):
+        """Run the next queued experiment, if any"""
+        try:
+            # Get next experiment from queue
+            experiment = self._get_next_experiment()
             
-            # Wait before checking again
-            time.sleep(10)
+            if experiment:
+                print(f"\n{'='*50}")
+                print(f"EXECUTING EXPERIMENT: {experiment}")
+                print(f"{'='*50}\n")
+                
+                # Simulate running the experiment
+                success = self._simulate_experiment(experiment)
+                
+                if success:
+                    self._log_success(experiment)
+                else:
+                    self._log_failure(experiment, "Simulated failure")
+            else:
+                print("No experiments in queue. Waiting...")
+        
+        except Exception as e:
+            print(f"Error in daemon loop: {e}")
     
     def _get_next_experiment(self):
         """Get the next experiment from the queue (simulated)"""
@@ -114,12 +198,27 @@ class MardukDaemon:
         }
         print(f"Logged: {log_entry}")
 
+def _load_config(config_path="bolt/config.yaml"):
+    """Load the Bolt configuration, returning an empty dict if it can't be read"""
+    import yaml
+    
+    try:
+        with open(config_path, "r") as f:
+            return yaml.safe_load(f) or {}
+    except Exception as e:
+        print(f"Error loading config: {e}")
+        return {}
+
 def main():
     # Use default paths or from arguments
     experiment_dir = "bolt/experiments"
     memory_dir = "memory/atoms"
     
-    daemon = MardukDaemon(experiment_dir, memory_dir)
+    # Write the PID file where the health check looks for it
+    config = _load_config()
+    pid_file = config.get("daemon", {}).get("pid_file", "bolt/daemon.pid")
+    
+    daemon = MardukDaemon(experiment_dir, memory_dir, pid_file)
     daemon.start()
 
 if __name__ == "__main__":
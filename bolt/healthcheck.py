@@ -6,42 +6,114 @@ Monitors the health of the Bolt framework and its components
 
 import os
 import sys
-import yaml
 import json
 import argparse
+import atexit
+import heapq
+import io
 import logging
-import psutil
-import platform
-import socket
+import logging.handlers
+import queue
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterator, Optional, Tuple
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
+# Heavy modules (yaml, psutil, platform, socket) are imported inside the
+# methods that use them so that --help and importing this module stay cheap.
+
+try:
+    import tomllib as _toml
+except ImportError:
+    import tomli as _toml
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Logging. Records are only enqueued on the calling thread; a single
+# listener thread does the console and file I/O. The listener, and with it
+# bolt_health.log, is only started once a health check is created.
+_log_queue = queue.Queue(-1)
+_log_listener = None
+
+logger = logging.getLogger("bolt-health")
+
+def _start_logging() -> None:
+    """Start the logging listener thread, if it isn't already running."""
+    global _log_listener
+    if _log_listener is not None:
+        return
+    
+    _log_listener = logging.handlers.QueueListener(
+        _log_queue,
         logging.StreamHandler(),
         logging.FileHandler("bolt_health.log")
-    ]
-)
+    )
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[logging.handlers.QueueHandler(_log_queue)]
+    )
 
-logger = logging.getLogger("bolt-health")
+# Prescan patterns for the required top-level fields of an experiment file
+_TOML_TABLE_RE = re.compile(rb'(?m)^[ \t]*\[')
+_TOML_NAME_RE = re.compile(rb'(?m)^[ \t]*name[ \t]*=[ \t]*(?:"([^"\\\n]*)"|\'([^\'\n]*)\')')
+_TOML_STEPS_KEY_RE = re.compile(rb'(?m)^[ \t]*steps[ \t]*=')
+_TOML_STEPS_TABLE_RE = re.compile(rb'(?m)^[ \t]*\[\[?[ \t]*steps[ \t]*\]\]?')
+
+# Shortest window a non-blocking CPU sample is allowed to cover
+CPU_SAMPLE_MIN_SECONDS = 0.1
+
+def _dump_report_json(report: Dict[str, Any]) -> bytes:
+    """Serialize a report as indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(report, option=orjson.OPT_INDENT_2)
+    return json.dumps(report, indent=2).encode("utf-8")
+
+def _load_json_bytes(data: bytes) -> Any:
+    """Parse raw JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 class BoltHealthCheck:
     def __init__(self, config_path: str = "bolt/config.yaml"):
         """Initialize the health check utility."""
+        _start_logging()
+        
         self.config_path = config_path
         self.config = self._load_config()
         self.start_time = datetime.now()
+        self._run_time = self.start_time
+        
+        # Resolve config lookups once rather than in every check
+        general_config = self.config.get("general", {})
+        daemon_config = self.config.get("daemon", {})
+        self.experiments_dir = general_config.get("experiments_dir", "bolt/experiments")
+        self.results_dir = general_config.get("results_dir", "bolt/results")
+        self.daemon_enabled = daemon_config.get("enabled", False)
+        self.daemon_pid_file = daemon_config.get("pid_file", "bolt/daemon.pid")
+        
+        # Scanned experiment files keyed by path, as (mtime_ns, (name, missing_fields))
+        self._toml_cache: Dict[str, Tuple[int, Tuple[str, List[str]]]] = {}
+        
+        # When psutil's CPU counters were last sampled; None until the first check
+        self._cpu_sampled_at: Optional[float] = None
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file."""
+        import yaml
+        
         try:
             with open(self.config_path, "r") as f:
                 config = yaml.safe_load(f)
-            return config
+            return config or {}
         except Exception as e:
             logger.error(f"Error loading config: {e}")
             return {}
@@ -54,34 +126,41 @@ class BoltHealthCheck:
         }
         
         # Check experiments directory
-        experiments_dir = self.config.get("general", {}).get("experiments_dir", "bolt/experiments")
+        experiments_dir = self.experiments_dir
         if not os.path.exists(experiments_dir):
             results["status"] = "warning"
             results["issues"].append(f"Experiments directory not found: {experiments_dir}")
         
         # Check results directory
-        results_dir = self.config.get("general", {}).get("results_dir", "bolt/results")
-        if not os.path.exists(results_dir):
-            try:
-                os.makedirs(results_dir)
-                results["issues"].append(f"Created missing results directory: {results_dir}")
-            except Exception as e:
-                results["status"] = "error"
-                results["issues"].append(f"Cannot create results directory: {results_dir}, error: {e}")
+        results_dir = self.results_dir
+        try:
+            os.makedirs(results_dir)
+            results["issues"].append(f"Created missing results directory: {results_dir}")
+        except FileExistsError:
+            pass
+        except OSError as e:
+            results["status"] = "error"
+            results["issues"].append(f"Cannot create results directory: {results_dir}, error: {e}")
         
         # Check disk space
         try:
-            disk_usage = psutil.disk_usage(os.path.dirname(experiments_dir))
+            # A single statvfs call, with the same accounting as psutil.disk_usage
+            stat = os.statvfs(os.path.dirname(experiments_dir) or ".")
+            total = stat.f_blocks * stat.f_frsize
+            used = (stat.f_blocks - stat.f_bfree) * stat.f_frsize
+            free = stat.f_bavail * stat.f_frsize
+            percent_used = round(used / (used + free) * 100, 1) if used + free else 0.0
+            
             results["disk"] = {
-                "total_gb": disk_usage.total / (1024**3),
-                "used_gb": disk_usage.used / (1024**3),
-                "free_gb": disk_usage.free / (1024**3),
-                "percent_used": disk_usage.percent
+                "total_gb": total / (1024**3),
+                "used_gb": used / (1024**3),
+                "free_gb": free / (1024**3),
+                "percent_used": percent_used
             }
             
-            if disk_usage.percent > 90:
+            if percent_used > 90:
                 results["status"] = "warning"
-                results["issues"].append(f"Disk space low: {disk_usage.percent}% used")
+                results["issues"].append(f"Disk space low: {percent_used}% used")
         except Exception as e:
             results["status"] = "error"
             results["issues"].append(f"Error checking disk space: {e}")
@@ -96,35 +175,35 @@ class BoltHealthCheck:
             "experiments": []
         }
         
-        experiments_dir = self.config.get("general", {}).get("experiments_dir", "bolt/experiments")
+        experiments_dir = self.experiments_dir
         if not os.path.exists(experiments_dir):
             results["status"] = "error"
             results["issues"].append(f"Experiments directory not found: {experiments_dir}")
             return results
         
-        # Check all TOML files
-        for filename in os.listdir(experiments_dir):
-            if not filename.endswith('.toml'):
-                continue
-            
-            filepath = os.path.join(experiments_dir, filename)
+        # Check all TOML files, only re-parsing those modified since the last run
+        toml_cache = {}
+        with os.scandir(experiments_dir) as entries:
+            toml_entries = [entry for entry in entries if entry.name.endswith('.toml')]
+        
+        for entry in toml_entries:
+            filename = entry.name
+            filepath = entry.path
             try:
-                with open(filepath, "rb") as f:
-                    import tomli
-                    exp_config = tomli.load(f)
+                mtime_ns = entry.stat().st_mtime_ns
+                cached = self._toml_cache.get(filepath)
+                if cached is not None and cached[0] == mtime_ns:
+                    exp_name, missing_fields = cached[1]
+                else:
+                    exp_name, missing_fields = self._scan_experiment_file(filepath)
+                toml_cache[filepath] = (mtime_ns, (exp_name, missing_fields))
                 
                 exp_info = {
-                    "name": exp_config.get("name", "Unnamed"),
+                    "name": exp_name,
                     "file": filename,
                     "status": "valid"
                 }
                 
-                # Check for required fields
-                missing_fields = []
-                for field in ["name", "steps"]:
-                    if field not in exp_config:
-                        missing_fields.append(field)
-                
                 if missing_fields:
                     exp_info["status"] = "invalid"
                     exp_info["issues"] = f"Missing required fields: {', '.join(missing_fields)}"
@@ -143,6 +222,8 @@ class BoltHealthCheck:
                     "issues": str(e)
                 })
         
+        self._toml_cache = toml_cache
+        
         # Count experiments
         valid_count = sum(1 for exp in results["experiments"] if exp["status"] == "valid")
         results["count"] = {
@@ -153,6 +234,27 @@ class BoltHealthCheck:
         
         return results
     
+    def _scan_experiment_file(self, filepath: str) -> Tuple[str, List[str]]:
+        """Return an experiment's name and any missing required fields.
+        
+        Files with a plain top-level name and steps are recognised by a regex
+        prescan; the full TOML parse only runs when the prescan misses.
+        """
+        with open(filepath, "rb") as f:
+            data = f.read()
+        
+        # Top-level keys can only appear before the first table header
+        header = _TOML_TABLE_RE.search(data)
+        top_level = data[:header.start()] if header else data
+        
+        name_match = _TOML_NAME_RE.search(top_level)
+        if name_match and (_TOML_STEPS_KEY_RE.search(top_level) or _TOML_STEPS_TABLE_RE.search(data)):
+            return (name_match.group(1) or name_match.group(2)).decode("utf-8"), []
+        
+        exp_config = _toml.loads(data.decode("utf-8"))
+        missing_fields = [field for field in ["name", "steps"] if field not in exp_config]
+        return exp_config.get("name", "Unnamed"), missing_fields
+    
     def check_recent_results(self) -> Dict[str, Any]:
         """Check recently completed experiments."""
         results = {
@@ -161,33 +263,20 @@ class BoltHealthCheck:
             "recent_results": []
         }
         
-        results_dir = self.config.get("general", {}).get("results_dir", "bolt/results")
+        results_dir = self.results_dir
         if not os.path.exists(results_dir):
             results["status"] = "warning"
             results["issues"].append(f"Results directory not found: {results_dir}")
             return results
         
-        # Get last modified time for each file
-        results_files = []
-        for filename in os.listdir(results_dir):
-            if not filename.endswith('.json'):
-                continue
-            
-            filepath = os.path.join(results_dir, filename)
-            try:
-                mtime = os.path.getmtime(filepath)
-                results_files.append((filepath, mtime))
-            except Exception:
-                continue
+        # Keep only the 5 most recently modified files while scanning
+        recent_files = heapq.nlargest(5, self._iter_result_files(results_dir))
         
-        # Sort by modification time (newest first)
-        results_files.sort(key=lambda x: x[1], reverse=True)
-        
-        # Check most recent files
-        for filepath, mtime in results_files[:5]:  # Check 5 most recent
+        # Check most recent files (newest first)
+        for mtime, filepath in recent_files:
             try:
-                with open(filepath, "r") as f:
-                    result_data = json.load(f)
+                with open(filepath, "rb") as f:
+                    result_data = _load_json_bytes(f.read())
                 
                 experiment_name = result_data.get("experiment_name", "Unknown")
                 success = result_data.get("success", False)
@@ -198,19 +287,22 @@ class BoltHealthCheck:
                     "file": os.path.basename(filepath),
                     "success": success,
                     "execution_time": execution_time,
-                    "steps_completed": len(result_data.get("steps", []))
+                    "steps_completed": result_data.get("steps_completed", len(result_data.get("steps", [])))
                 }
                 
                 results["recent_results"].append(result_info)
                 
                 if not success:
-                    # Look for errors in steps
-                    error_steps = [step for step in result_data.get("steps", []) 
-                                   if step.get("status") == "error"]
-                    
-                    if error_steps:
-                        first_error = error_steps[0]
-                        result_info["error"] = first_error.get("error", "Unknown error")
+                    # Summaries record the first error; older files list every step
+                    if result_data.get("first_error"):
+                        result_info["error"] = result_data["first_error"]
+                    else:
+                        error_steps = [step for step in result_data.get("steps", []) 
+                                       if step.get("status") == "error"]
+                        
+                        if error_steps:
+                            first_error = error_steps[0]
+                            result_info["error"] = first_error.get("error", "Unknown error")
                 
             except Exception as e:
                 results["status"] = "warning"
@@ -229,8 +321,24 @@ class BoltHealthCheck:
         
         return results
     
+    def _iter_result_files(self, results_dir: str) -> Iterator[Tuple[float, str]]:
+        """Yield (mtime, path) for each JSON result file in results_dir."""
+        with os.scandir(results_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.json'):
+                    continue
+                
+                try:
+                    yield entry.stat().st_mtime, entry.path
+                except OSError:
+                    continue
+    
     def check_system_resources(self) -> Dict[str, Any]:
         """Check system resource usage."""
+        import platform
+        import socket
+        import psutil
+        
         results = {
             "status": "healthy",
             "issues": []
@@ -238,7 +346,18 @@ class BoltHealthCheck:
         
         # Check CPU usage
         try:
-            cpu_percent = psutil.cpu_percent(interval=1)
+            if self._cpu_sampled_at is None:
+                # Prime psutil so cpu_percent reports the delta since now
+                # instead of blocking to take its own sample
+                psutil.cpu_percent(interval=None)
+                self._cpu_sampled_at = time.monotonic()
+            
+            elapsed = time.monotonic() - self._cpu_sampled_at
+            if elapsed < CPU_SAMPLE_MIN_SECONDS:
+                time.sleep(CPU_SAMPLE_MIN_SECONDS - elapsed)
+            
+            cpu_percent = psutil.cpu_percent(interval=None)
+            self._cpu_sampled_at = time.monotonic()
             results["cpu"] = {
                 "percent": cpu_percent,
                 "cores": psutil.cpu_count()
@@ -277,27 +396,58 @@ class BoltHealthCheck:
     
     def check_daemon_status(self) -> Dict[str, Any]:
         """Check the status of the Bolt daemon."""
+        import psutil
+        
         results = {
             "status": "unknown",
             "issues": []
         }
         
         # Check if daemon is enabled in config
-        daemon_enabled = self.config.get("daemon", {}).get("enabled", False)
-        if not daemon_enabled:
+        if not self.daemon_enabled:
             results["status"] = "disabled"
             return results
         
-        # On Linux, we could check for process
+        # Look up the daemon through the PID file it writes on startup
+        pid_file = self.daemon_pid_file
+        try:
+            with open(pid_file, "r") as f:
+                pid = int(f.read().strip())
+        except (OSError, ValueError):
+            pid = None
+        
+        if pid is not None:
+            try:
+                if os.path.exists("/proc/self/stat"):
+                    # On Linux, read /proc directly rather than going through psutil
+                    uptime = self._read_proc_uptime(pid)
+                else:
+                    uptime = time.time() - psutil.Process(pid).create_time()
+            except psutil.NoSuchProcess:
+                uptime = None
+            except Exception as e:
+                results["issues"].append(f"Error checking daemon process: {e}")
+                return results
+            
+            if uptime is None:
+                results["status"] = "not_running"
+                results["issues"].append(f"Daemon is enabled but not running (stale PID file: {pid_file})")
+            else:
+                results["pid"] = pid
+                results["uptime"] = uptime
+                results["status"] = "running"
+            return results
+        
+        # No PID file, fall back to scanning for the process
         try:
             daemon_running = False
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+            for proc in psutil.process_iter(['pid', 'cmdline', 'create_time']):
                 try:
-                    cmdline = proc.info.get('cmdline', [])
-                    if cmdline and 'bolt/agents/daemon.py' in ' '.join(cmdline):
+                    cmdline = proc.info.get('cmdline') or []
+                    if any(arg.endswith('bolt/agents/daemon.py') for arg in cmdline):
                         daemon_running = True
                         results["pid"] = proc.info.get('pid')
-                        results["uptime"] = time.time() - proc.create_time()
+                        results["uptime"] = time.time() - proc.info['create_time']
                         results["status"] = "running"
                         break
                 except Exception:
@@ -311,23 +461,58 @@ class BoltHealthCheck:
         
         return results
     
+    def _read_proc_uptime(self, pid: int) -> Optional[float]:
+        """Return the uptime of a daemon process from /proc, or None if it is not running."""
+        try:
+            with open(f"/proc/{pid}/comm", "r") as f:
+                name = f.read().strip()
+            with open(f"/proc/{pid}/stat", "r") as f:
+                stat = f.read()
+            with open("/proc/uptime", "r") as f:
+                system_uptime = float(f.read().split()[0])
+        except FileNotFoundError:
+            return None
+        
+        # A reused PID that now belongs to another program is not our daemon
+        if not (name.startswith("python") or name == "marduk"):
+            return None
+        
+        # starttime is field 22, counted in clock ticks since boot. The
+        # command name in field 2 may contain spaces, so split after it.
+        start_ticks = int(stat.rpartition(")")[2].split()[19])
+        return system_uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+    
     def run_all_checks(self) -> Dict[str, Any]:
         """Run all health checks and compile a report."""
         logger.info("Running Bolt health checks...")
         
-        # Run all checks
-        file_system = self.check_file_system()
-        experiment_files = self.check_experiment_files()
-        recent_results = self.check_recent_results()
-        system_resources = self.check_system_resources()
-        daemon_status = self.check_daemon_status()
+        # One timestamp per run, shared by the report and its filename
+        self._run_time = datetime.now()
+        
+        # The file system check creates a missing results directory, which
+        # the recent results check relies on, so it runs first
+        check_results = {"file_system": self.check_file_system()}
+        
+        # The remaining checks don't depend on each other and are I/O-bound,
+        # so run them concurrently
+        checks = {
+            "experiment_files": self.check_experiment_files,
+            "recent_results": self.check_recent_results,
+            "system_resources": self.check_system_resources,
+            "daemon_status": self.check_daemon_status
+        }
+        
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = {executor.submit(check): name for name, check in checks.items()}
+            for future in as_completed(futures):
+                check_results[futures[future]] = future.result()
         
         # Determine overall status
         statuses = [
-            file_system["status"],
-            experiment_files["status"],
-            recent_results["status"],
-            system_resources["status"]
+            check_results["file_system"]["status"],
+            check_results["experiment_files"]["status"],
+            check_results["recent_results"]["status"],
+            check_results["system_resources"]["status"]
         ]
         
         if "error" in statuses:
@@ -339,13 +524,13 @@ class BoltHealthCheck:
         
         # Compile report
         report = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._run_time.isoformat(),
             "overall_status": overall_status,
-            "file_system": file_system,
-            "experiment_files": experiment_files,
-            "recent_results": recent_results,
-            "system_resources": system_resources,
-            "daemon_status": daemon_status
+            "file_system": check_results["file_system"],
+            "experiment_files": check_results["experiment_files"],
+            "recent_results": check_results["recent_results"],
+            "system_resources": check_results["system_resources"],
+            "daemon_status": check_results["daemon_status"]
         }
         
         logger.info(f"Health check complete. Status: {overall_status}")
@@ -363,12 +548,12 @@ class BoltHealthCheck:
             os.makedirs(reports_dir, exist_ok=True)
             
             # Generate filename
-            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+            timestamp = self._run_time.strftime("%Y%m%d-%H%M%S")
             filename = f"{reports_dir}/health_{timestamp}.json"
             
             # Write report to file
-            with open(filename, 'w') as f:
-                json.dump(report, f, indent=2)
+            with open(filename, 'wb') as f:
+                f.write(_dump_report_json(report))
             
             logger.info(f"Health report saved to {filename}")
         except Exception as e:
@@ -379,71 +564,72 @@ class BoltHealthCheck:
         timestamp = report["timestamp"]
         status = report["overall_status"].upper()
         
-        md = f"# Bolt Health Report\n\n"
-        md += f"Generated: {timestamp}\n\n"
-        md += f"## Overall Status: {status}\n\n"
+        buf = io.StringIO()
+        buf.write("# Bolt Health Report\n\n")
+        buf.write(f"Generated: {timestamp}\n\n")
+        buf.write(f"## Overall Status: {status}\n\n")
         
         # System Resources
-        md += "## System Resources\n\n"
+        buf.write("## System Resources\n\n")
         system = report["system_resources"]
         
         if "system" in system:
             sys_info = system["system"]
-            md += f"- **Platform**: {sys_info.get('platform', 'Unknown')}\n"
-            md += f"- **Python**: {sys_info.get('python', 'Unknown')}\n"
-            md += f"- **Hostname**: {sys_info.get('hostname', 'Unknown')}\n\n"
+            buf.write(f"- **Platform**: {sys_info.get('platform', 'Unknown')}\n")
+            buf.write(f"- **Python**: {sys_info.get('python', 'Unknown')}\n")
+            buf.write(f"- **Hostname**: {sys_info.get('hostname', 'Unknown')}\n\n")
         
         if "cpu" in system:
             cpu = system["cpu"]
-            md += f"- **CPU**: {cpu.get('percent', 0)}% (Cores: {cpu.get('cores', 'Unknown')})\n"
+            buf.write(f"- **CPU**: {cpu.get('percent', 0)}% (Cores: {cpu.get('cores', 'Unknown')})\n")
         
         if "memory" in system:
             mem = system["memory"]
-            md += f"- **Memory**: {mem.get('percent_used', 0)}% used ({mem.get('used_gb', 0):.2f} GB / {mem.get('total_gb', 0):.2f} GB)\n"
+            buf.write(f"- **Memory**: {mem.get('percent_used', 0)}% used ({mem.get('used_gb', 0):.2f} GB / {mem.get('total_gb', 0):.2f} GB)\n")
         
         if "disk" in report["file_system"]:
             disk = report["file_system"]["disk"]
-            md += f"- **Disk**: {disk.get('percent_used', 0)}% used ({disk.get('used_gb', 0):.2f} GB / {disk.get('total_gb', 0):.2f} GB)\n"
+            buf.write(f"- **Disk**: {disk.get('percent_used', 0)}% used ({disk.get('used_gb', 0):.2f} GB / {disk.get('total_gb', 0):.2f} GB)\n")
         
         # Daemon Status
-        md += "\n## Daemon Status\n\n"
+        buf.write("\n## Daemon Status\n\n")
         daemon = report["daemon_status"]
         status_text = daemon["status"].replace("_", " ").title()
-        md += f"- **Status**: {status_text}\n"
+        buf.write(f"- **Status**: {status_text}\n")
         
         if daemon["status"] == "running":
             uptime = daemon.get("uptime", 0)
             uptime_str = str(timedelta(seconds=int(uptime)))
-            md += f"- **PID**: {daemon.get('pid', 'Unknown')}\n"
-            md += f"- **Uptime**: {uptime_str}\n"
+            buf.write(f"- **PID**: {daemon.get('pid', 'Unknown')}\n")
+            buf.write(f"- **Uptime**: {uptime_str}\n")
         
         # Experiment Files
-        md += "\n## Experiment Files\n\n"
+        buf.write("\n## Experiment Files\n\n")
         exp_files = report["experiment_files"]
         counts = exp_files.get("count", {})
         
-        md += f"- **Total**: {counts.get('total', 0)}\n"
-        md += f"- **Valid**: {counts.get('valid', 0)}\n"
-        md += f"- **Invalid**: {counts.get('invalid', 0)}\n\n"
+        buf.write(f"- **Total**: {counts.get('total', 0)}\n")
+        buf.write(f"- **Valid**: {counts.get('valid', 0)}\n")
+        buf.write(f"- **Invalid**: {counts.get('invalid', 0)}\n\n")
         
         if counts.get("invalid", 0) > 0:
-            md += "### Invalid Experiments\n\n"
+            buf.write("### Invalid Experiments\n\n")
             invalid_exps = [exp for exp in exp_files.get("experiments", []) if exp["status"] != "valid"]
             
             for exp in invalid_exps:
-                md += f"- **{exp.get('name', 'Unknown')}** ({exp.get('file', '')}): {exp.get('issues', 'Unknown issue')}\n"
+                buf.write(f"- **{exp.get('name', 'Unknown')}** ({exp.get('file', '')}): {exp.get('issues', 'Unknown issue')}\n")
         
         # Recent Results
-        md += "\n## Recent Experiment Results\n\n"
+        buf.write("\n## Recent Experiment Results\n\n")
         results = report["recent_results"]
         
         if "success_rate" in results:
             success_rate = results["success_rate"] * 100
-            md += f"- **Recent Success Rate**: {success_rate:.1f}%\n\n"
+            buf.write(f"- **Recent Success Rate**: {success_rate:.1f}%\n\n")
         
-        md += "### Latest Experiments\n\n"
-        md += "| Experiment | Status | Time | Steps |\n"
-        md += "|------------|--------|------|-------|\n"
+        buf.write("### Latest Experiments\n\n")
+        buf.write("| Experiment | Status | Time | Steps |\n")
+        buf.write("|------------|--------|------|-------|\n")
         
         for result in results.get("recent_results", []):
             status = "✅" if result.get("success", False) else "❌"
@@ -451,7 +637,7 @@ class BoltHealthCheck:
             time_str = result.get("execution_time", "").split("T")[0]
             steps = result.get("steps_completed", 0)
             
-            md += f"| {name} | {status} | {time_str} | {steps} |\n"
+            buf.write(f"| {name} | {status} | {time_str} | {steps} |\n")
         
         # Issues
         all_issues = []
@@ -462,11 +648,11 @@ class BoltHealthCheck:
                     all_issues.extend([f"**{section.replace('_', ' ').title()}**: {issue}" for issue in section_issues])
         
         if all_issues:
-            md += "\n## Issues Detected\n\n"
+            buf.write("\n## Issues Detected\n\n")
             for issue in all_issues:
-                md += f"- {issue}\n"
+                buf.write(f"- {issue}\n")
         
-        return md
+        return buf.getvalue()
 
 def main():
     parser = argparse.ArgumentParser(description="Check Bolt framework health")
@@ -489,11 +675,11 @@ def main():
             print(md_report)
     else:
         if args.output:
-            with open(args.output, 'w') as f:
-                json.dump(report, f, indent=2)
+            with open(args.output, 'wb') as f:
+                f.write(_dump_report_json(report))
             print(f"JSON report written to {args.output}")
         else:
-            print(json.dumps(report, indent=2))
+            print(_dump_report_json(report).decode("utf-8"))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
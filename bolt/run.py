@@ -7,27 +7,234 @@ Executes experiments defined in TOML files with enhanced error handling and logg
 import os
 import sys
 import argparse
-import tomli
+import atexit
+import copy
+import functools
+import hashlib
 import time
-import yaml
 import logging
-import json
+import logging.handlers
+import pickle
+import queue
+import random
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Set, Tuple, BinaryIO, Callable
 
-# Set up logging
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The TOML, YAML and json modules are imported on first use so that paths
+# which never parse a file (e.g. --help) don't pay for them.
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler that buffers writes, flushing them within flush_interval seconds.
+    
+    Records at flush_level or above (warnings and errors by default) are
+    flushed immediately, like MemoryHandler's flushLevel.
+    """
+    
+    def __init__(self, filename: str, mode: str = "a", encoding: Optional[str] = None,
+                 buffer_size: int = 65536, flush_interval: float = 5.0,
+                 flush_level: int = logging.WARNING):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self._flush_timer: Optional[threading.Timer] = None
+        super().__init__(filename, mode, encoding)
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            
+            self.stream.write(self.format(record) + self.terminator)
+            
+            # Flush warnings and errors now; otherwise make sure a timer will
+            # flush the buffer even if no further records arrive
+            if record.levelno >= self.flush_level:
+                self.flush()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval, self._timed_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        except Exception:
+            self.handleError(record)
+    
+    def _timed_flush(self):
+        """Flush the records buffered since the timer was started."""
+        with self.lock:
+            self._flush_timer = None
+            self.flush()
+    
+    def close(self):
+        with self.lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        super().close()
+
+# Set up logging. Records are only enqueued on the calling thread; a single
+# listener thread does the console and file I/O.
 log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+_log_queue = queue.Queue(-1)
+_log_file_handler = BufferedFileHandler("bolt.log")
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.StreamHandler(),
+    _log_file_handler
+)
+_log_listener.start()
+atexit.register(_log_file_handler.close)
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
     format=log_format,
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("bolt.log")
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
 
 logger = logging.getLogger("bolt")
 
+# Banner separators for the run log
+SEP = "=" * 50
+SUB = "-" * 30
+
+# Parsed config documents keyed by path, as ((mtime_ns, size), document)
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+# Node-local cache shared by concurrent runs, so configs on slow network
+# filesystems are read and parsed once per node rather than once per run
+_SHM_DIR = "/dev/shm"
+
+def _shm_cache_path(path: str) -> Optional[str]:
+    """Per-user cache file for path in shared memory, or None if unavailable."""
+    if not hasattr(os, "getuid") or not os.path.isdir(_SHM_DIR):
+        return None
+    key = hashlib.blake2b(os.path.abspath(path).encode(), digest_size=8).hexdigest()
+    return os.path.join(_SHM_DIR, f"bolt_cfg_{os.getuid()}_{key}.pkl")
+
+def _shm_load(cache_path: str, version: Tuple[int, int]) -> Tuple[bool, Any]:
+    """Return (True, document) if the shared cache holds this version of the file."""
+    try:
+        fd = os.open(cache_path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    except OSError:
+        return False, None
+    
+    with os.fdopen(fd, "rb") as f:
+        # Only unpickle files we wrote: owned by us and private to us
+        st = os.fstat(fd)
+        if st.st_uid != os.getuid() or st.st_mode & 0o077:
+            return False, None
+        try:
+            cached_version, document = pickle.load(f)
+        except Exception:
+            return False, None
+    
+    if tuple(cached_version) != version:
+        return False, None
+    return True, document
+
+def _shm_store(cache_path: str, version: Tuple[int, int], document: Any):
+    """Publish a parsed document to the shared cache; failures are ignored."""
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_NOFOLLOW", 0), 0o600)
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((version, document), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+def _cached_parse(path: str, loader: Callable[[BinaryIO], Any]) -> Any:
+    """Parse a config file with loader, reusing the result until the file changes."""
+    st = os.stat(path)
+    version = (st.st_mtime_ns, st.st_size)
+    
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    
+    cache_path = _shm_cache_path(path)
+    hit = False
+    if cache_path is not None:
+        hit, document = _shm_load(cache_path, version)
+    
+    if not hit:
+        with open(path, "rb") as f:
+            document = loader(f)
+        if cache_path is not None:
+            _shm_store(cache_path, version, document)
+    
+    _CONFIG_CACHE[path] = (version, document)
+    return document
+
+def _load_yaml(stream: BinaryIO) -> Any:
+    """Safely load a YAML document with the fastest available loader."""
+    import yaml
+    
+    # Prefer the libyaml-backed loader; fall back to pure Python where it is missing
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(stream, Loader=loader)
+
+def _load_toml(stream: BinaryIO) -> Any:
+    """Load a TOML document with tomllib, or tomli before Python 3.11."""
+    try:
+        import tomllib as toml
+    except ImportError:
+        import tomli as toml
+    return toml.load(stream)
+
+# Directories this process has already created or confirmed
+_ensured_dirs: Set[str] = set()
+
+def _ensure_dir(path: str):
+    """Create path if needed, skipping the syscall for directories seen before."""
+    if path in _ensured_dirs:
+        return
+    os.makedirs(path, exist_ok=True)
+    _ensured_dirs.add(path)
+
+def _dump_json(obj: Any) -> bytes:
+    """Serialize obj as compact JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    import json
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+class NonRetriableError(Exception):
+    """Raised by operations for failures that retrying cannot fix."""
+
+class CircuitOpenError(NonRetriableError):
+    """Raised when an operation is skipped because its circuit breaker is open."""
+
+# OSErrors that retrying the same request cannot fix
+PERMANENT_OS_ERRORS = (FileNotFoundError, FileExistsError, PermissionError,
+                       IsADirectoryError, NotADirectoryError)
+
+def _is_retriable(error: Exception) -> bool:
+    """
+    Whether error is a transient failure worth retrying.
+    
+    OSError covers timeouts, dropped connections and other I/O failures.
+    Any other exception, including NonRetriableError, the permanent OSErrors
+    above and errors from malformed step config, fails the step on the
+    first attempt.
+    """
+    return isinstance(error, OSError) and not isinstance(error, PERMANENT_OS_ERRORS)
+
 class BoltExperiment:
     def __init__(self, config_path: str, env: str = "production"):
         """
@@ -43,13 +250,28 @@ class BoltExperiment:
         self.results = {}
         self.start_time = None
         self.end_time = None
+        self._timestamp_str = None
         self.load_system_config()
+        
+        # Per-operation circuit breakers: op name -> {"failures", "open_until"}
+        self._breaker: Dict[str, Dict[str, float]] = {}
+        self._breaker_lock = threading.Lock()
+        
+        # Operation handlers by op name; each takes (step, op_config, idempotency_key)
+        self._op_handlers = {
+            "search": self._op_search,
+            "cluster": self._op_cluster,
+            "summarize": self._op_summarize,
+            "publish": self._op_publish
+        }
+        
+        # Validate every step up front so no step runs if any is malformed
+        self._validation_errors = self._validate_config()
     
     def load_system_config(self):
         """Load the system configuration."""
         try:
-            with open("bolt/config.yaml", "rb") as f:
-                self.system_config = yaml.safe_load(f)
+            self.system_config = _cached_parse("bolt/config.yaml", _load_yaml)
                 
             # Set log level from config
             log_level = self.system_config.get("general", {}).get("log_level", "info").upper()
@@ -59,209 +281,435 @@ class BoltExperiment:
         except Exception as e:
             logger.warning(f"Could not load system configuration: {e}")
             self.system_config = {"general": {}, "execution": {}, "operations": {}}
+        
+        # Resolve execution defaults once rather than on every step and retry
+        self._exec_cfg = self.system_config.get("execution", {})
+        self._ops_cfg = self.system_config.get("operations", {})
+        self._default_timeout = self._exec_cfg.get("timeout", 3600)
+        self._default_max_retries = self._exec_cfg.get("max_retries", 3)
+        self._retry_delay = self._exec_cfg.get("retry_delay", 5)
+        self._retry_max_delay = self._exec_cfg.get("retry_max_delay", 60)
+        self._breaker_threshold = self._exec_cfg.get("breaker_threshold", 5)
+        self._breaker_cooldown = self._exec_cfg.get("breaker_cooldown", 60)
     
     def _load_config(self) -> Dict[str, Any]:
         """Load experiment configuration from TOML file."""
         try:
-            with open(self.config_path, "rb") as f:
-                config = tomli.load(f)
+            # Validation normalizes steps in place, so don't touch the cached document
+            config = copy.deepcopy(_cached_parse(self.config_path, _load_toml))
             logger.info(f"Loaded experiment: {config.get('name', 'Unnamed experiment')}")
             return config
         except Exception as e:
             logger.error(f"Error loading experiment config: {e}")
             sys.exit(1)
     
+    def _validate_config(self) -> List[str]:
+        """Check all steps before execution, returning one message per problem."""
+        steps = self.config.get('steps')
+        if steps is None:
+            return []
+        if not isinstance(steps, list):
+            return ["'steps' must be an array of tables"]
+        
+        errors = []
+        for i, step in enumerate(steps):
+            if not isinstance(step, dict):
+                errors.append(f"Step {i+1}: must be a table")
+                continue
+            
+            op_type = step.get('op')
+            if op_type is None:
+                errors.append(f"Step {i+1}: missing 'op' field")
+            elif not isinstance(op_type, str):
+                errors.append(f"Step {i+1}: 'op' must be a string")
+            elif op_type not in self._op_handlers:
+                errors.append(f"Step {i+1}: unknown operation '{op_type}'")
+            else:
+                # Share one string object with the dispatch table keys
+                step['op'] = sys.intern(op_type)
+            
+            timeout = step.get('timeout')
+            if timeout is not None and (isinstance(timeout, bool) or not isinstance(timeout, (int, float)) or timeout <= 0):
+                errors.append(f"Step {i+1}: 'timeout' must be a positive number")
+            
+            max_retries = step.get('max_retries')
+            if max_retries is not None and (isinstance(max_retries, bool) or not isinstance(max_retries, int) or max_retries < 0):
+                errors.append(f"Step {i+1}: 'max_retries' must be a non-negative integer")
+            
+            group = step.get('parallel_group')
+            if group is not None and (isinstance(group, bool) or not isinstance(group, (str, int))):
+                errors.append(f"Step {i+1}: 'parallel_group' must be a string or integer")
+        
+        return errors
+    
     def run(self) -> bool:
         """Execute the experiment steps."""
         self.start_time = datetime.now()
+        self._timestamp_str = self.start_time.strftime("%Y%m%d-%H%M%S")
+        start_ns = time.monotonic_ns()
         
-        logger.info(f"{'='*50}")
-        logger.info(f"EXECUTING EXPERIMENT: {self.config.get('name', 'Unnamed')}")
-        logger.info(f"DESCRIPTION: {self.config.get('description', 'No description')}")
-        logger.info(f"{'='*50}")
+        logger.info(SEP)
+        logger.info("EXECUTING EXPERIMENT: %s", self.config.get('name', 'Unnamed'))
+        logger.info("DESCRIPTION: %s", self.config.get('description', 'No description'))
+        logger.info(SEP)
         
         if 'steps' not in self.config:
             logger.error("No steps defined in experiment config")
             return False
         
+        if self._validation_errors:
+            for error in self._validation_errors:
+                logger.error("Invalid experiment config: %s", error)
+            logger.error("No steps were run")
+            
+            self.end_time = datetime.now()
+            self.results = {
+                "experiment_name": self.config.get('name', 'Unnamed'),
+                "execution_time": self.start_time.isoformat(),
+                "completion_time": self.end_time.isoformat(),
+                "duration_seconds": (time.monotonic_ns() - start_ns) / 1e9,
+                "steps_file": None,
+                "steps_completed": 0,
+                "steps_failed": 0,
+                "first_error": self._validation_errors[0],
+                "validation_errors": self._validation_errors,
+                "success": False
+            }
+            self._save_results()
+            return False
+        
         steps = self.config['steps']
-        step_results = []
+        steps_file = self._open_steps_file()
+        steps_completed = 0
+        steps_failed = 0
+        first_error = None
         success = True
         
-        for i, step in enumerate(steps):
-            logger.info(f"\nStep {i+1}/{len(steps)}: {step.get('op', 'unknown')}")
-            logger.info(f"{'-'*30}")
-            
-            if 'op' not in step:
-                logger.error("Error: Step missing 'op' field")
-                step_results.append({
-                    "status": "error", 
-                    "error": "Missing 'op' field",
-                    "step_index": i
-                })
-                success = False
-                continue
-            
-            # Get timeout for this step
-            timeout = step.get("timeout", 
-                        self.system_config.get("execution", {}).get("timeout", 3600))
-            
-            max_retries = step.get("max_retries", 
-                           self.system_config.get("execution", {}).get("max_retries", 3))
-            
-            retry_delay = self.system_config.get("execution", {}).get("retry_delay", 5)
-            
-            # Execute the step with retries
-            result = None
-            last_error = None
-            for retry in range(max_retries + 1):
-                try:
-                    if retry > 0:
-                        logger.info(f"Retry {retry}/{max_retries} after {retry_delay}s delay")
-                        time.sleep(retry_delay)
+        try:
+            for batch in self._group_steps(steps):
+                if len(batch) > 1:
+                    batch_results = self._run_parallel_steps(batch, len(steps))
+                else:
+                    i, step = batch[0]
+                    batch_results = [self._run_step(i, step, len(steps))]
+                
+                stop = False
+                for (i, step), (step_result, step_ok) in zip(batch, batch_results):
+                    # Persist each result as soon as it is known
+                    if steps_file is not None:
+                        steps_file.write(_dump_json(step_result) + b"\n")
+                        steps_file.flush()
                     
-                    result = self._execute_operation(step, timeout)
-                    break
-                except Exception as e:
-                    last_error = str(e)
-                    logger.error(f"Error executing step: {e}")
-            
-            if result:
-                step_results.append(result)
-                logger.info(f"Operation completed successfully")
-            else:
-                error_result = {
-                    "status": "error",
-                    "error": last_error or "Unknown error",
-                    "step_index": i,
-                    "step": step
-                }
-                step_results.append(error_result)
-                logger.error(f"Step failed after {max_retries} retries")
-                success = False
+                    steps_completed += 1
+                    if first_error is None and step_result.get("status") == "error":
+                        first_error = step_result.get("error", "Unknown error")
+                    
+                    if step_ok:
+                        continue
+                    
+                    steps_failed += 1
+                    success = False
+                    # Check if we should continue on error
+                    if not step.get("continue_on_error", False):
+                        stop = True
                 
-                # Check if we should continue on error
-                if not step.get("continue_on_error", False):
+                if stop:
                     logger.error("Stopping experiment due to step failure")
                     break
+        finally:
+            if steps_file is not None:
+                steps_file.close()
         
         self.end_time = datetime.now()
-        duration = (self.end_time - self.start_time).total_seconds()
+        # Monotonic clock so wall-clock adjustments cannot skew the duration
+        duration = (time.monotonic_ns() - start_ns) / 1e9
         
         self.results = {
             "experiment_name": self.config.get('name', 'Unnamed'),
             "execution_time": self.start_time.isoformat(),
             "completion_time": self.end_time.isoformat(),
             "duration_seconds": duration,
-            "steps": step_results,
+            "steps_file": os.path.basename(steps_file.name) if steps_file is not None else None,
+            "steps_completed": steps_completed,
+            "steps_failed": steps_failed,
+            "first_error": first_error,
             "success": success
         }
         
         # Save results
         self._save_results()
         
-        logger.info(f"\n{'='*50}")
-        logger.info(f"EXPERIMENT COMPLETE: {'SUCCESS' if success else 'FAILURE'}")
-        logger.info(f"Duration: {duration:.2f} seconds")
-        logger.info(f"{'='*50}\n")
+        logger.info("\n%s", SEP)
+        logger.info("EXPERIMENT COMPLETE: %s", 'SUCCESS' if success else 'FAILURE')
+        logger.info("Duration: %.2f seconds", duration)
+        logger.info("%s\n", SEP)
         
         return success
     
-    def _execute_operation(self, step: Dict[str, Any], timeout: int) -> Dict[str, Any]:
+    def _group_steps(self, steps: List[Dict[str, Any]]) -> List[List[Tuple[int, Dict[str, Any]]]]:
+        """
+        Split steps into batches that can run together.
+        
+        When parallel_steps is enabled, consecutive steps sharing a
+        parallel_group form one batch; every other step is a batch of one.
+        """
+        batches = []
+        parallel = self._exec_cfg.get("parallel_steps", False)
+        
+        for i, step in enumerate(steps):
+            group = step.get("parallel_group") if parallel else None
+            if (group is not None and batches
+                    and batches[-1][-1][1].get("parallel_group") == group):
+                batches[-1].append((i, step))
+            else:
+                batches.append([(i, step)])
+        
+        return batches
+    
+    def _run_parallel_steps(self, batch: List[Tuple[int, Dict[str, Any]]],
+                            total_steps: int) -> List[Tuple[Dict[str, Any], bool]]:
+        """Run a batch of steps concurrently, returning results in step order."""
+        max_workers = min(len(batch), self._exec_cfg.get("parallel_workers", 8))
+        results = [None] * len(batch)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._run_step, i, step, total_steps): position
+                for position, (i, step) in enumerate(batch)
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        return results
+    
+    def _run_step(self, i: int, step: Dict[str, Any], total_steps: int) -> Tuple[Dict[str, Any], bool]:
+        """Execute one step with retries, returning its result and whether it succeeded."""
+        logger.info("\nStep %d/%d: %s", i + 1, total_steps, step.get('op', 'unknown'))
+        logger.info(SUB)
+        
+        # Get timeout for this step
+        timeout = step.get("timeout", self._default_timeout)
+        max_retries = step.get("max_retries", self._default_max_retries)
+        
+        # One key for every attempt, so a retried non-idempotent op
+        # (e.g. publish) can be de-duplicated downstream
+        idempotency_key = uuid.uuid4().hex
+        
+        # Execute the step with retries
+        result = None
+        last_error = None
+        attempts = 0
+        for retry in range(max_retries + 1):
+            attempts += 1
+            try:
+                if retry > 0:
+                    delay = self._backoff_delay(retry)
+                    logger.info("Retry %d/%d after %.1fs delay", retry, max_retries, delay)
+                    time.sleep(delay)
+                
+                result = self._execute_operation(step, timeout, idempotency_key)
+                break
+            except Exception as e:
+                last_error = str(e)
+                if not _is_retriable(e):
+                    # Permanent failure (or open circuit); retrying cannot help
+                    logger.error("Error executing step (not retrying): %s", e)
+                    break
+                logger.error("Error executing step: %s", e)
+        
+        if result:
+            logger.info("Operation completed successfully")
+            return result, True
+        
+        logger.error("Step failed after %d attempt(s)", attempts)
+        return {
+            "status": "error",
+            "error": last_error or "Unknown error",
+            "step_index": i,
+            "step": step
+        }, False
+    
+    def _execute_operation(self, step: Dict[str, Any], timeout: int,
+                           idempotency_key: Optional[str] = None) -> Dict[str, Any]:
         """Execute a single operation step with timeout."""
         op_type = step['op']
         
         # Get operation settings from system config
-        op_config = self.system_config.get("operations", {}).get(op_type, {})
+        op_config = self._ops_cfg.get(op_type, {})
         
-        # Simulate different operation types
-        if op_type == "search":
-            query = step.get('query', 'all')
-            shovel = step.get('shovel', 'default')
-            threshold = step.get('threshold', op_config.get('default_threshold', 0.7))
-            
-            logger.info(f"Searching for: {query} using {shovel} (threshold: {threshold})")
-            time.sleep(1)  # Simulate work
-            
-            return {
-                "status": "success", 
-                "found": 42, 
-                "query": query,
-                "shovel": shovel,
-                "threshold": threshold
-            }
-            
-        elif op_type == "cluster":
-            algorithm = step.get('algorithm', op_config.get('default_algorithm', 'kmeans'))
-            k = step.get('k', op_config.get('default_k', 5))
-            
-            logger.info(f"Clustering using {algorithm} with k={k}")
-            time.sleep(1.5)  # Simulate work
-            
-            return {
-                "status": "success", 
-                "clusters": k, 
-                "algorithm": algorithm
-            }
-            
-        elif op_type == "summarize":
-            temp = step.get('temperature', op_config.get('default_temperature', 0.7))
-            max_tokens = step.get('max_tokens', op_config.get('max_tokens', 500))
-            
-            logger.info(f"Summarizing with temperature {temp}, max_tokens {max_tokens}")
-            time.sleep(2)  # Simulate work
-            
-            return {
-                "status": "success", 
-                "temperature": temp,
-                "max_tokens": max_tokens
-            }
-            
-        elif op_type == "publish":
-            channel = step.get('channel', op_config.get('default_channel', 'default'))
-            
-            logger.info(f"Publishing to channel: {channel}")
-            time.sleep(0.5)  # Simulate work
-            
-            return {
-                "status": "success", 
-                "channel": channel
-            }
-            
-        else:
-            logger.error(f"Unknown operation type: {op_type}")
+        handler = self._op_handlers.get(op_type)
+        if handler is None:
+            logger.error("Unknown operation type: %s", op_type)
             return {
                 "status": "error", 
                 "error": f"Unknown operation: {op_type}"
             }
+        
+        self._check_breaker(op_type)
+        try:
+            result = handler(step, op_config, idempotency_key)
+        except Exception:
+            self._record_failure(op_type)
+            raise
+        
+        self._record_success(op_type)
+        return result
+    
+    def _backoff_delay(self, retry: int) -> float:
+        """Exponential backoff from retry_delay, capped and with jitter."""
+        delay = min(self._retry_max_delay, self._retry_delay * 2 ** (retry - 1))
+        return delay * (0.5 + random.random())
+    
+    def _check_breaker(self, op_type: str):
+        """Raise CircuitOpenError if op_type has failed too often recently."""
+        with self._breaker_lock:
+            state = self._breaker.get(op_type)
+            if state is not None and state["open_until"] > time.monotonic():
+                raise CircuitOpenError(f"Circuit open for operation: {op_type}")
+    
+    def _record_failure(self, op_type: str):
+        """Count a failure and open the breaker after too many in a row."""
+        with self._breaker_lock:
+            state = self._breaker.setdefault(op_type, {"failures": 0, "open_until": 0.0})
+            state["failures"] += 1
+            if state["failures"] >= self._breaker_threshold:
+                state["open_until"] = time.monotonic() + self._breaker_cooldown
+                state["failures"] = 0
+                logger.warning("Circuit opened for operation %s for %ss", op_type, self._breaker_cooldown)
+    
+    def _record_success(self, op_type: str):
+        """Reset the failure count for op_type."""
+        with self._breaker_lock:
+            self._breaker.pop(op_type, None)
+    
+    def _op_search(self, step: Dict[str, Any], op_config: Dict[str, Any],
+                   idempotency_key: Optional[str]) -> Dict[str, Any]:
+        """Search for memory atoms (simulated)."""
+        g = step.get
+        og = op_config.get
+        query = g('query', 'all')
+        shovel = g('shovel', 'default')
+        threshold = g('threshold', og('default_threshold', 0.7))
+        
+        logger.info("Searching for: %s using %s (threshold: %s)", query, shovel, threshold)
+        time.sleep(1)  # Simulate work
+        
+        return {
+            "status": "success", 
+            "found": 42, 
+            "query": query,
+            "shovel": shovel,
+            "threshold": threshold
+        }
+    
+    def _op_cluster(self, step: Dict[str, Any], op_config: Dict[str, Any],
+                    idempotency_key: Optional[str]) -> Dict[str, Any]:
+        """Cluster atoms by similarity (simulated)."""
+        g = step.get
+        og = op_config.get
+        algorithm = g('algorithm', og('default_algorithm', 'kmeans'))
+        k = g('k', og('default_k', 5))
+        
+        logger.info("Clustering using %s with k=%s", algorithm, k)
+        time.sleep(1.5)  # Simulate work
+        
+        return {
+            "status": "success", 
+            "clusters": k, 
+            "algorithm": algorithm
+        }
+    
+    def _op_summarize(self, step: Dict[str, Any], op_config: Dict[str, Any],
+                      idempotency_key: Optional[str]) -> Dict[str, Any]:
+        """
+        Generate summaries of atom clusters (simulated).
+        
+        Not idempotent; idempotency_key is sent as the Idempotency-Key
+        header once a real client is wired in.
+        """
+        g = step.get
+        og = op_config.get
+        temp = g('temperature', og('default_temperature', 0.7))
+        max_tokens = g('max_tokens', og('max_tokens', 500))
+        
+        logger.info("Summarizing with temperature %s, max_tokens %s", temp, max_tokens)
+        time.sleep(2)  # Simulate work
+        
+        return {
+            "status": "success", 
+            "temperature": temp,
+            "max_tokens": max_tokens,
+            "idempotency_key": idempotency_key
+        }
+    
+    def _op_publish(self, step: Dict[str, Any], op_config: Dict[str, Any],
+                    idempotency_key: Optional[str]) -> Dict[str, Any]:
+        """
+        Publish results to a channel (simulated).
+        
+        Not idempotent; idempotency_key is sent as the Idempotency-Key
+        header once a real client is wired in.
+        """
+        g = step.get
+        og = op_config.get
+        channel = g('channel', og('default_channel', 'default'))
+        
+        logger.info("Publishing to channel: %s", channel)
+        time.sleep(0.5)  # Simulate work
+        
+        return {
+            "status": "success", 
+            "channel": channel,
+            "idempotency_key": idempotency_key
+        }
+    
+    def _results_path(self, extension: str) -> str:
+        """Path of this run's results file with the given extension."""
+        results_dir = self.system_config.get("general", {}).get("results_dir", "bolt/results")
+        exp_name = self.config.get('name', 'unnamed').lower().replace(' ', '_')
+        return f"{results_dir}/{exp_name}_{self._timestamp_str}{extension}"
+    
+    def _open_steps_file(self) -> Optional[BinaryIO]:
+        """Open the line-delimited JSON file that step results are streamed to."""
+        try:
+            filename = self._results_path(".ndjson")
+            _ensure_dir(os.path.dirname(filename))
+            return open(filename, 'wb')
+        except Exception as e:
+            logger.error(f"Error opening step results file: {e}")
+            return None
     
     def _save_results(self):
-        """Save experiment results to file."""
+        """Save the experiment summary to file."""
         try:
             # Create results directory if it doesn't exist
-            results_dir = self.system_config.get("general", {}).get("results_dir", "bolt/results")
-            os.makedirs(results_dir, exist_ok=True)
-            
-            # Generate filename
-            timestamp = self.start_time.strftime("%Y%m%d-%H%M%S")
-            exp_name = self.config.get('name', 'unnamed').lower().replace(' ', '_')
-            filename = f"{results_dir}/{exp_name}_{timestamp}.json"
+            filename = self._results_path(".json")
+            _ensure_dir(os.path.dirname(filename))
             
-            # Write results to file
-            with open(filename, 'w') as f:
-                json.dump(self.results, f, indent=2)
+            # Write results straight to the descriptor, bypassing Python's file buffering
+            data = memoryview(_dump_json(self.results) + b"\n")
+            fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
             
             logger.info(f"Results saved to {filename}")
         except Exception as e:
             logger.error(f"Error saving results: {e}")
 
-def main():
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser once per process."""
     parser = argparse.ArgumentParser(description="Run a Bolt experiment")
     parser.add_argument('--experiment', required=True, help='Path to experiment TOML file')
     parser.add_argument('--env', default='production', choices=['development', 'staging', 'production'],
                        help='Environment to run in')
-    
-    args = parser.parse_args()
+    return parser
+
+def main():
+    args = _build_parser().parse_args()
     
     if not os.path.exists(args.experiment):
         logger.error(f"Experiment file not found: {args.experiment}")
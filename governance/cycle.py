@@ -7,14 +7,190 @@ Manages the alternation between LightFace exploration and DarkFace synthesis.
 import os
 import sys
 import json
-import yaml
 import argparse
+import copy
+import functools
+import mmap
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from enum import IntEnum
+from typing import Dict, List, Any, Optional, Tuple
 import random
+import string
+from concurrent.futures import ThreadPoolExecutor
 
-from lightface import LightFaceExploration
-from darkface import DarkFaceSynthesis
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# yaml and the LightFace/DarkFace modules are imported on first use, so
+# commands such as --list don't pay for them.
+
+# Generator for simulated phase results, separate from the global random state
+_rng = random.Random()
+
+# Threads used to overlap file reads in list_cycles
+LIST_READ_WORKERS = 8
+
+# Cycle files at least this large are memory-mapped by list_cycles rather than
+# copied into a bytes object (only when orjson, which can parse a mapping, is
+# available)
+MMAP_MIN_SIZE = 64 * 1024
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a YAML file, memoized on its path and stat signature.
+    
+    Args:
+        path: Absolute path to the YAML file
+        mtime_ns: Modification time of the file, in nanoseconds
+        size: Size of the file in bytes
+        
+    Returns:
+        The parsed document
+    """
+    import yaml
+    
+    # Prefer the libyaml-backed loader; fall back to pure Python where it is missing
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=loader)
+
+def _dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize obj as JSON, compact unless pretty, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def _dumps_line(obj: Any) -> bytes:
+    """Serialize obj as one line of compact JSON, newline included."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8') + b'\n'
+
+def _loads(data: bytes) -> Any:
+    """Parse a JSON document, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+class CycleState(IntEnum):
+    """Where a cycle is in its lifecycle, stored as "status_code"."""
+    INIT = 0        # Started, no phase yet
+    LIGHTFACE = 1   # LightFace phase active
+    DARKFACE = 2    # DarkFace phase active
+    COMPLETE = 3    # Latest phase completed
+    CLOSED = 4      # Cycle completed
+
+# Allowed (state, action) -> next state. Missing pairs are invalid.
+_TRANSITIONS = {
+    **{(state, "start_lightface"): CycleState.LIGHTFACE
+       for state in (CycleState.INIT, CycleState.LIGHTFACE, CycleState.DARKFACE, CycleState.COMPLETE)},
+    **{(state, "start_darkface"): CycleState.DARKFACE
+       for state in (CycleState.INIT, CycleState.LIGHTFACE, CycleState.DARKFACE, CycleState.COMPLETE)},
+    (CycleState.LIGHTFACE, "complete_phase"): CycleState.COMPLETE,
+    (CycleState.DARKFACE, "complete_phase"): CycleState.COMPLETE,
+    (CycleState.INIT, "complete_cycle"): CycleState.CLOSED,
+    (CycleState.COMPLETE, "complete_cycle"): CycleState.CLOSED,
+}
+
+# State for each "current_phase" string of an active cycle
+_PHASE_STATES = {
+    "init": CycleState.INIT,
+    "lightface": CycleState.LIGHTFACE,
+    "darkface": CycleState.DARKFACE,
+    "complete": CycleState.COMPLETE,
+}
+
+# Policy written by the CLI when the requested config file does not exist.
+# Kept pre-rendered so creating it doesn't need the YAML emitter.
+_DEFAULT_CONFIG_YAML = b"""name: "Default Toroidal Grammar Policy"
+description: "Default policy for balancing exploration and synthesis"
+version: "1.0.0"
+default_cycle_name: "Toroidal Cycle"
+
+lightface:
+  topic: "cognitive architecture"
+  duration: 2
+  constraints: []
+
+darkface:
+  title: "Synthesis Session"
+  criteria: []
+
+cycle:
+  auto_advance: false
+  phases:
+    - "lightface"
+    - "darkface"
+"""
+
+# Markdown template for generated cycle summaries
+_SUMMARY_TEMPLATE = """# Toroidal Cycle: {name}
+
+## Overview
+This cycle explored {topics} through a structured process of exploration (LightFace) and synthesis (DarkFace). The cycle ran from {start_date} to {end_date}.
+
+## Exploration Phase
+The LightFace exploration phase generated {exploration_nodes} nodes across {exploration_branches} branches, exploring various aspects of {main_topic}. Key themes that emerged included:
+- Theoretical frameworks for understanding the domain
+- Practical applications and implementation strategies
+- Integration patterns with existing systems
+- Emergent properties and unexpected connections
+
+## Synthesis Phase
+The DarkFace synthesis phase distilled the exploration into {synthesis_clusters} main clusters, generating {synthesis_nodes} synthesis nodes. The synthesis achieved a quality score of {quality_score:.2f}, indicating a {quality_text} level of coherence and insight.
+
+## Outcomes
+This cycle produced several valuable outcomes:
+1. A coherent framework for understanding {main_topic}
+2. New connections between previously separate concepts
+3. Identification of promising research directions
+4. Practical guidelines for implementation
+
+## Next Steps
+Based on the results of this cycle, recommended next steps include:
+- Deeper exploration of the most promising themes
+- Practical testing of the synthesized framework
+- Integration with existing knowledge bases
+- Initiation of a new cycle focusing on emergent questions
+"""
+
+def _compile_template(template: str):
+    """
+    Compile a str.format template into a function built around one f-string.
+    
+    The placeholders are resolved once here, so rendering skips format's
+    per-call template parsing and keyword lookups.
+    
+    Args:
+        template: A template using named str.format placeholders
+        
+    Returns:
+        A function taking the template's fields as keyword arguments
+    """
+    fields = []
+    pieces = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        pieces.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field is None:
+            continue
+        if not field.isidentifier():
+            raise ValueError(f"Unsupported template field: {field!r}")
+        if field not in fields:
+            fields.append(field)
+        pieces.append("{" + field + (f"!{conversion}" if conversion else "") + (f":{spec}" if spec else "") + "}")
+    
+    source = f"def render(*, {', '.join(fields)}):\n    return f{''.join(pieces)!r}\n"
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)
+    return namespace["render"]
+
+# Renders the summary template from its fields as keyword arguments
+_render_summary = _compile_template(_SUMMARY_TEMPLATE)
 
 class ToroidalCycle:
     def __init__(self, config_path: str, output_dir: str = "governance/cycles"):
@@ -31,22 +207,243 @@ class ToroidalCycle:
         # Load the configuration
         self.config = self._load_config()
         
-        # Initialize the explorers and synthesizers
-        self.explorer = LightFaceExploration("governance/explorations")
-        self.synthesizer = DarkFaceSynthesis("governance/syntheses")
+        # The explorer and synthesizer are created on first use
+        self._explorer = None
+        self._synthesizer = None
+        
+        # (snapshot, event log) paths by cycle ID
+        self._path_cache: Dict[str, Tuple[str, str]] = {}
         
         # Create the output directory
         os.makedirs(output_dir, exist_ok=True)
     
+    @property
+    def explorer(self):
+        """The LightFace exploration manager."""
+        if self._explorer is None:
+            from lightface import LightFaceExploration
+            self._explorer = LightFaceExploration("governance/explorations")
+        return self._explorer
+    
+    @property
+    def synthesizer(self):
+        """The DarkFace synthesis manager."""
+        if self._synthesizer is None:
+            from darkface import DarkFaceSynthesis
+            self._synthesizer = DarkFaceSynthesis("governance/syntheses")
+        return self._synthesizer
+    
     def _load_config(self) -> Dict[str, Any]:
         """Load the configuration from a YAML file."""
-        if not os.path.exists(self.config_path):
+        path = os.path.abspath(self.config_path)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
             raise ValueError(f"Configuration file not found: {self.config_path}")
         
-        with open(self.config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        # The cached document is shared, so hand each instance its own copy
+        config = _load_yaml_cached(path, st.st_mtime_ns, st.st_size)
+        return copy.deepcopy(config)
+    
+    def _cycle_paths(self, cycle_id: str) -> Tuple[str, str]:
+        """Paths of a cycle's snapshot file and its phase-event log."""
+        paths = self._path_cache.get(cycle_id)
+        if paths is None:
+            base = os.path.join(self.output_dir, cycle_id)
+            paths = (f"{base}.json", f"{base}.log.ndjson")
+            self._path_cache[cycle_id] = paths
+        return paths
+    
+    def _load_cycle(self, cycle_id: str) -> Dict[str, Any]:
+        """
+        Load a cycle: its last snapshot with any logged phase events replayed
+        on top.
         
-        return config
+        Args:
+            cycle_id: The cycle ID
+            
+        Returns:
+            The cycle, freshly parsed and owned by the caller
+        """
+        cycle_file, log_file = self._cycle_paths(cycle_id)
+        try:
+            with open(cycle_file, 'rb') as f:
+                cycle = _loads(f.read())
+        except FileNotFoundError:
+            raise ValueError(f"Cycle not found: {cycle_id}")
+        
+        try:
+            with open(log_file, 'rb') as f:
+                log_data = f.read()
+        except FileNotFoundError:
+            log_data = b""
+        
+        if log_data:
+            self._replay_events(cycle, log_data)
+        
+        return cycle
+    
+    def _write_cycle(self, cycle_id: str, cycle: Dict[str, Any], durable: bool = False):
+        """
+        Write a full snapshot of a cycle.
+        
+        The snapshot is written to a temporary file and renamed into place, so
+        readers never see a partial file. It includes every logged event, so
+        the event log is removed.
+        
+        Args:
+            cycle_id: The cycle ID
+            cycle: The cycle
+            durable: Whether to fsync the snapshot before returning
+        """
+        cycle_file, log_file = self._cycle_paths(cycle_id)
+        tmp_file = f"{cycle_file}.{os.getpid()}.tmp"
+        
+        data = memoryview(_dumps(cycle, pretty=True))
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            try:
+                while data:
+                    data = data[os.write(fd, data):]
+                if durable:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+            
+            os.replace(tmp_file, cycle_file)
+        except OSError:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+            raise
+        if durable:
+            self._fsync_dir()
+        
+        try:
+            os.remove(log_file)
+        except FileNotFoundError:
+            pass
+    
+    def _fsync_dir(self):
+        """Flush the output directory's entries, making renames in it durable."""
+        try:
+            fd = os.open(self.output_dir, os.O_RDONLY)
+        except OSError:
+            # Directories can't be opened on every platform
+            return
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    
+    def _append_event(self, cycle_id: str, event: Dict[str, Any]):
+        """
+        Append a phase event to a cycle's log instead of rewriting its snapshot.
+        
+        A torn final line left by an interrupted append is truncated first, so
+        the new event starts on a line of its own.
+        
+        Args:
+            cycle_id: The cycle ID
+            event: The phase event
+        """
+        cycle_file, log_file = self._cycle_paths(cycle_id)
+        with open(log_file, 'a+b') as f:
+            end = f.seek(0, os.SEEK_END)
+            if end:
+                f.seek(end - 1)
+                if f.read(1) != b"\n":
+                    f.seek(0)
+                    f.truncate(f.read().rfind(b"\n") + 1)
+            f.write(_dumps_line(event))
+    
+    def _replay_events(self, cycle: Dict[str, Any], log_data: bytes):
+        """
+        Apply a cycle's logged phase events, in order, to its snapshot.
+        
+        Every event ends with a newline, so anything after the last one is a
+        partially written event and is ignored.
+        """
+        lines = log_data.split(b"\n")
+        for line in lines[:-1]:
+            if line:
+                self._apply_event(cycle, _loads(line))
+    
+    def _apply_event(self, cycle: Dict[str, Any], event: Dict[str, Any]):
+        """
+        Apply one phase event to a cycle.
+        
+        Events carry the index of the phase they touch, so replaying an event
+        that a snapshot already includes leaves the cycle unchanged.
+        """
+        phases = cycle["phases"]
+        index = event["index"]
+        phase = event["phase"]
+        
+        if event["event"] == "phase_started":
+            if index == len(phases):
+                self._phase_indexes(cycle, phase["type"]).append(index)
+                phases.append(phase)
+        elif event["event"] == "phase_completed":
+            phases[index] = phase
+        
+        cycle["current_phase"] = event["current_phase"]
+        cycle["status_code"] = int(_PHASE_STATES[event["current_phase"]])
+        cycle["updated_at"] = event["updated_at"]
+    
+    def _cycle_state(self, cycle: Dict[str, Any]) -> int:
+        """Get a cycle's CycleState, deriving it for cycles written without one."""
+        code = cycle.get("status_code")
+        if code is None:
+            if cycle["status"] != "active":
+                return CycleState.CLOSED
+            return _PHASE_STATES[cycle["current_phase"]]
+        return code
+    
+    def _next_state(self, cycle: Dict[str, Any], action: str) -> CycleState:
+        """
+        Look up the state an action moves a cycle to.
+        
+        Args:
+            cycle: The cycle
+            action: The action name in the transition table
+            
+        Returns:
+            The next state
+            
+        Raises:
+            ValueError: If the action is not allowed in the cycle's state
+        """
+        state = self._cycle_state(cycle)
+        if state == CycleState.CLOSED:
+            raise ValueError(f"Cycle is not active: {cycle['id']}")
+        
+        next_state = _TRANSITIONS.get((state, action))
+        if next_state is None:
+            if action == "complete_phase":
+                raise ValueError(f"No active phase in cycle: {cycle['id']}")
+            raise ValueError(f"Cannot {action.replace('_', ' ')} from state {CycleState(state).name}: {cycle['id']}")
+        return next_state
+    
+    def _phase_indexes(self, cycle: Dict[str, Any], phase_type: str) -> List[int]:
+        """
+        Get the positions of a cycle's phases of one type, in order.
+        
+        Args:
+            cycle: The cycle
+            phase_type: "lightface" or "darkface"
+            
+        Returns:
+            The cycle's own index list; append to it when adding a phase
+        """
+        key = f"_{phase_type}_idx"
+        indexes = cycle.get(key)
+        if indexes is None:
+            # Cycles written before the indexes existed
+            indexes = [i for i, p in enumerate(cycle["phases"]) if p["type"] == phase_type]
+            cycle[key] = indexes
+        return indexes
     
     def start_cycle(self, cycle_name: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -59,7 +456,9 @@ class ToroidalCycle:
             Cycle metadata
         """
         # Generate a cycle ID
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        now_iso = now.isoformat()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         cycle_id = f"cycle_{timestamp}"
         
         # Get cycle name
@@ -71,22 +470,25 @@ class ToroidalCycle:
             "id": cycle_id,
             "name": cycle_name,
             "config_name": os.path.basename(self.config_path),
-            "start_time": datetime.now().isoformat(),
+            "start_time": now_iso,
             "status": "active",
+            "status_code": int(CycleState.INIT),
             "phases": [],
+            "_lightface_idx": [],
+            "_darkface_idx": [],
             "current_phase": "init",
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat()
+            "created_at": now_iso,
+            "updated_at": now_iso
         }
         
         # Save the cycle metadata
-        cycle_file = os.path.join(self.output_dir, f"{cycle_id}.json")
-        with open(cycle_file, 'w') as f:
-            json.dump(cycle, f, indent=2)
+        self._write_cycle(cycle_id, cycle)
         
-        print(f"Toroidal cycle started: {cycle_id}")
-        print(f"Name: {cycle_name}")
-        print(f"Configuration: {os.path.basename(self.config_path)}")
+        sys.stdout.write(
+            f"Toroidal cycle started: {cycle_id}\n"
+            f"Name: {cycle_name}\n"
+            f"Configuration: {os.path.basename(self.config_path)}\n"
+        )
         
         return cycle
     
@@ -101,16 +503,10 @@ class ToroidalCycle:
             The updated cycle with the exploration phase
         """
         # Load the cycle
-        cycle_file = os.path.join(self.output_dir, f"{cycle_id}.json")
-        if not os.path.exists(cycle_file):
-            raise ValueError(f"Cycle not found: {cycle_id}")
+        cycle = self._load_cycle(cycle_id)
         
-        with open(cycle_file, 'r') as f:
-            cycle = json.load(f)
-        
-        # Check if the cycle is active
-        if cycle["status"] != "active":
-            raise ValueError(f"Cycle is not active: {cycle_id}")
+        # Check that a LightFace phase can start
+        self._next_state(cycle, "start_lightface")
         
         # Get exploration configuration
         exploration_config = self.config.get("lightface", {})
@@ -121,27 +517,35 @@ class ToroidalCycle:
         exploration = self.explorer.start_exploration(topic, duration)
         
         # Add the phase to the cycle
+        now = datetime.now()
+        now_iso = now.isoformat()
         phase = {
             "type": "lightface",
             "exploration_id": exploration["id"],
             "topic": topic,
-            "start_time": datetime.now().isoformat(),
+            "start_time": now_iso,
             "status": "active",
-            "end_time": (datetime.now() + timedelta(days=duration)).isoformat()
+            "end_time": (now + timedelta(days=duration)).isoformat()
         }
         
-        cycle["phases"].append(phase)
-        cycle["current_phase"] = "lightface"
-        cycle["updated_at"] = datetime.now().isoformat()
+        event = {
+            "event": "phase_started",
+            "index": len(cycle["phases"]),
+            "phase": phase,
+            "current_phase": "lightface",
+            "updated_at": now_iso
+        }
+        self._apply_event(cycle, event)
         
-        # Save the updated cycle
-        with open(cycle_file, 'w') as f:
-            json.dump(cycle, f, indent=2)
+        # Log the new phase
+        self._append_event(cycle_id, event)
         
-        print(f"Started LightFace phase for cycle: {cycle_id}")
-        print(f"Exploration ID: {exploration['id']}")
-        print(f"Topic: {topic}")
-        print(f"Duration: {duration} days")
+        sys.stdout.write(
+            f"Started LightFace phase for cycle: {cycle_id}\n"
+            f"Exploration ID: {exploration['id']}\n"
+            f"Topic: {topic}\n"
+            f"Duration: {duration} days\n"
+        )
         
         return cycle
     
@@ -157,25 +561,19 @@ class ToroidalCycle:
             The updated cycle with the synthesis phase
         """
         # Load the cycle
-        cycle_file = os.path.join(self.output_dir, f"{cycle_id}.json")
-        if not os.path.exists(cycle_file):
-            raise ValueError(f"Cycle not found: {cycle_id}")
-        
-        with open(cycle_file, 'r') as f:
-            cycle = json.load(f)
+        cycle = self._load_cycle(cycle_id)
         
-        # Check if the cycle is active
-        if cycle["status"] != "active":
-            raise ValueError(f"Cycle is not active: {cycle_id}")
+        # Check that a DarkFace phase can start
+        self._next_state(cycle, "start_darkface")
         
         # Find the exploration to synthesize
         if exploration_id is None:
             # Get the most recent LightFace phase
-            lightface_phases = [p for p in cycle["phases"] if p["type"] == "lightface"]
-            if not lightface_phases:
+            lightface_idx = self._phase_indexes(cycle, "lightface")
+            if not lightface_idx:
                 raise ValueError(f"No LightFace phase found in cycle: {cycle_id}")
             
-            exploration_id = lightface_phases[-1]["exploration_id"]
+            exploration_id = cycle["phases"][lightface_idx[-1]]["exploration_id"]
         
         # Get synthesis configuration
         synthesis_config = self.config.get("darkface", {})
@@ -185,26 +583,33 @@ class ToroidalCycle:
         synthesis = self.synthesizer.start_synthesis(exploration_id, title)
         
         # Add the phase to the cycle
+        now_iso = datetime.now().isoformat()
         phase = {
             "type": "darkface",
             "synthesis_id": synthesis["id"],
             "exploration_id": exploration_id,
             "title": title,
-            "start_time": datetime.now().isoformat(),
+            "start_time": now_iso,
             "status": "active"
         }
         
-        cycle["phases"].append(phase)
-        cycle["current_phase"] = "darkface"
-        cycle["updated_at"] = datetime.now().isoformat()
+        event = {
+            "event": "phase_started",
+            "index": len(cycle["phases"]),
+            "phase": phase,
+            "current_phase": "darkface",
+            "updated_at": now_iso
+        }
+        self._apply_event(cycle, event)
         
-        # Save the updated cycle
-        with open(cycle_file, 'w') as f:
-            json.dump(cycle, f, indent=2)
+        # Log the new phase
+        self._append_event(cycle_id, event)
         
-        print(f"Started DarkFace phase for cycle: {cycle_id}")
-        print(f"Synthesis ID: {synthesis['id']}")
-        print(f"Based on exploration: {exploration_id}")
+        sys.stdout.write(
+            f"Started DarkFace phase for cycle: {cycle_id}\n"
+            f"Synthesis ID: {synthesis['id']}\n"
+            f"Based on exploration: {exploration_id}\n"
+        )
         
         return cycle
     
@@ -218,27 +623,16 @@ class ToroidalCycle:
         Returns:
             The updated cycle
         """
-        # Load the cycle
-        cycle_file = os.path.join(self.output_dir, f"{cycle_id}.json")
-        if not os.path.exists(cycle_file):
-            raise ValueError(f"Cycle not found: {cycle_id}")
+        now_iso = datetime.now().isoformat()
         
-        with open(cycle_file, 'r') as f:
-            cycle = json.load(f)
-        
-        # Check if the cycle is active
-        if cycle["status"] != "active":
-            raise ValueError(f"Cycle is not active: {cycle_id}")
+        # Load the cycle
+        cycle = self._load_cycle(cycle_id)
         
-        # Get the current phase
-        if not cycle["phases"]:
-            raise ValueError(f"No active phase in cycle: {cycle_id}")
+        # Check that there is an active phase to complete
+        self._next_state(cycle, "complete_phase")
         
         current_phase = cycle["phases"][-1]
         
-        if current_phase["status"] != "active":
-            raise ValueError(f"Current phase is not active: {current_phase['type']}")
-        
         # Complete the phase based on its type
         if current_phase["type"] == "lightface":
             # Complete the exploration
@@ -246,13 +640,14 @@ class ToroidalCycle:
             self.explorer.end_exploration(exploration_id)
             
             current_phase["status"] = "completed"
-            current_phase["completion_time"] = datetime.now().isoformat()
+            current_phase["completion_time"] = now_iso
             
             # Add some simulated results
+            randint = _rng.randint
             current_phase["results"] = {
-                "nodes_created": random.randint(10, 30),
-                "branches_created": random.randint(5, 20),
-                "unique_tags": random.randint(8, 15)
+                "nodes_created": randint(10, 30),
+                "branches_created": randint(5, 20),
+                "unique_tags": randint(8, 15)
             }
         
         elif current_phase["type"] == "darkface":
@@ -270,11 +665,11 @@ class ToroidalCycle:
             
             # Finalize the synthesis
             summary = "The synthesis identified several key themes and integrated them into a cohesive framework."
-            quality_score = random.uniform(0.7, 0.95)
+            quality_score = _rng.uniform(0.7, 0.95)
             self.synthesizer.finalize_synthesis(synthesis_id, summary, quality_score)
             
             current_phase["status"] = "completed"
-            current_phase["completion_time"] = datetime.now().isoformat()
+            current_phase["completion_time"] = now_iso
             
             # Add some simulated results
             current_phase["results"] = {
@@ -284,12 +679,17 @@ class ToroidalCycle:
             }
         
         # Update the cycle
-        cycle["current_phase"] = "complete"
-        cycle["updated_at"] = datetime.now().isoformat()
+        event = {
+            "event": "phase_completed",
+            "index": len(cycle["phases"]) - 1,
+            "phase": current_phase,
+            "current_phase": "complete",
+            "updated_at": now_iso
+        }
+        self._apply_event(cycle, event)
         
-        # Save the updated cycle
-        with open(cycle_file, 'w') as f:
-            json.dump(cycle, f, indent=2)
+        # Log the completed phase
+        self._append_event(cycle_id, event)
         
         print(f"Completed {current_phase['type']} phase for cycle: {cycle_id}")
         
@@ -307,41 +707,36 @@ class ToroidalCycle:
             The updated cycle
         """
         # Load the cycle
-        cycle_file = os.path.join(self.output_dir, f"{cycle_id}.json")
-        if not os.path.exists(cycle_file):
-            raise ValueError(f"Cycle not found: {cycle_id}")
-        
-        with open(cycle_file, 'r') as f:
-            cycle = json.load(f)
+        cycle = self._load_cycle(cycle_id)
         
         # Check if the cycle is active
-        if cycle["status"] != "active":
+        state = self._cycle_state(cycle)
+        if state == CycleState.CLOSED:
             raise ValueError(f"Cycle is not active: {cycle_id}")
         
         # Complete any active phase
-        if cycle["current_phase"] not in ["init", "complete"]:
-            self.complete_phase(cycle_id)
-            
-            # Reload the cycle after completing the phase
-            with open(cycle_file, 'r') as f:
-                cycle = json.load(f)
+        if state in (CycleState.LIGHTFACE, CycleState.DARKFACE):
+            cycle = self.complete_phase(cycle_id)
         
         # Generate a summary if not provided
         if summary is None:
             summary = self._generate_cycle_summary(cycle)
         
         # Update the cycle
+        now_iso = datetime.now().isoformat()
+        cycle["status_code"] = int(self._next_state(cycle, "complete_cycle"))
         cycle["status"] = "completed"
         cycle["summary"] = summary
-        cycle["completion_time"] = datetime.now().isoformat()
-        cycle["updated_at"] = datetime.now().isoformat()
+        cycle["completion_time"] = now_iso
+        cycle["updated_at"] = now_iso
         
-        # Save the updated cycle
-        with open(cycle_file, 'w') as f:
-            json.dump(cycle, f, indent=2)
+        # Save the final cycle, flushed to disk
+        self._write_cycle(cycle_id, cycle, durable=True)
         
-        print(f"Completed cycle: {cycle_id}")
-        print(f"Phases completed: {len(cycle['phases'])}")
+        sys.stdout.write(
+            f"Completed cycle: {cycle_id}\n"
+            f"Phases completed: {len(cycle['phases'])}\n"
+        )
         
         return cycle
     
@@ -355,32 +750,76 @@ class ToroidalCycle:
         Returns:
             List of cycles
         """
-        cycles = []
+        with os.scandir(self.output_dir) as it:
+            entries = [entry for entry in it
+                       if entry.name.startswith("cycle_") and entry.name.endswith(".json")]
         
-        for file in os.listdir(self.output_dir):
-            if file.startswith("cycle_") and file.endswith(".json"):
-                file_path = os.path.join(self.output_dir, file)
-                
-                try:
-                    with open(file_path, 'r') as f:
-                        cycle = json.load(f)
-                    
-                    # Apply status filter if provided
-                    if status is None or cycle.get("status") == status:
-                        cycles.append(cycle)
+        # Read the files concurrently so their I/O overlaps
+        with ThreadPoolExecutor(max_workers=LIST_READ_WORKERS) as pool:
+            contents = pool.map(self._read_cycle_file, [entry.path for entry in entries])
+        
+        cycles = []
+        for entry, (data, log_data, error) in zip(entries, contents):
+            try:
+                if error is not None:
+                    raise error
+                if isinstance(data, mmap.mmap):
+                    try:
+                        with memoryview(data) as view:
+                            cycle = _loads(view)
+                    finally:
+                        data.close()
+                else:
+                    cycle = _loads(data)
+                if log_data:
+                    self._replay_events(cycle, log_data)
                 
-                except Exception as e:
-                    print(f"Error reading cycle file {file}: {e}")
+                # Apply status filter if provided
+                if status is None or cycle.get("status") == status:
+                    cycles.append(cycle)
+            
+            except Exception as e:
+                print(f"Error reading cycle file {entry.name}: {e}")
         
         # Sort by start time (newest first)
         cycles.sort(key=lambda x: x.get("start_time", ""), reverse=True)
         
         return cycles
     
+    def _read_cycle_file(self, path: str) -> Tuple[Any, Optional[bytes], Optional[Exception]]:
+        """
+        Read a cycle snapshot and its event log, returning (data, log_data, error).
+        
+        Large snapshots are returned as a read-only mmap, which the caller closes.
+        """
+        try:
+            with open(path, 'rb') as f:
+                if orjson is not None and os.fstat(f.fileno()).st_size >= MMAP_MIN_SIZE:
+                    data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    data = f.read()
+        except (OSError, ValueError) as e:
+            return None, None, e
+        
+        try:
+            with open(f"{path[:-len('.json')]}.log.ndjson", 'rb') as f:
+                log_data = f.read()
+        except FileNotFoundError:
+            log_data = None
+        except OSError as e:
+            if isinstance(data, mmap.mmap):
+                data.close()
+            return None, None, e
+        
+        return data, log_data, None
+    
     def simulate_cycle(self, name: Optional[str] = None) -> Dict[str, Any]:
         """
         Simulate a complete toroidal cycle for demo purposes.
         
+        The steps run in order: each one reads the cycle, exploration or
+        synthesis state that the step before it wrote.
+        
         Args:
             name: Optional name for the cycle
             
@@ -417,44 +856,35 @@ class ToroidalCycle:
     
     def _generate_cycle_summary(self, cycle: Dict[str, Any]) -> str:
         """Generate a summary for a completed cycle."""
-        lightface_phases = [p for p in cycle["phases"] if p["type"] == "lightface"]
-        darkface_phases = [p for p in cycle["phases"] if p["type"] == "darkface"]
+        # Gather topics and stats in one pass over the phases
+        topics = []
+        total_exploration_nodes = 0
+        total_exploration_branches = 0
+        total_synthesis_clusters = 0
+        total_synthesis_nodes = 0
+        avg_quality_score = 0.0
+        darkface_count = 0
         
-        template = """# Toroidal Cycle: {name}
-
-## Overview
-This cycle explored {topics} through a structured process of exploration (LightFace) and synthesis (DarkFace). The cycle ran from {start_date} to {end_date}.
-
-## Exploration Phase
-The LightFace exploration phase generated {exploration_nodes} nodes across {exploration_branches} branches, exploring various aspects of {main_topic}. Key themes that emerged included:
-- Theoretical frameworks for understanding the domain
-- Practical applications and implementation strategies
-- Integration patterns with existing systems
-- Emergent properties and unexpected connections
-
-## Synthesis Phase
-The DarkFace synthesis phase distilled the exploration into {synthesis_clusters} main clusters, generating {synthesis_nodes} synthesis nodes. The synthesis achieved a quality score of {quality_score:.2f}, indicating a {quality_text} level of coherence and insight.
-
-## Outcomes
-This cycle produced several valuable outcomes:
-1. A coherent framework for understanding {main_topic}
-2. New connections between previously separate concepts
-3. Identification of promising research directions
-4. Practical guidelines for implementation
-
-## Next Steps
-Based on the results of this cycle, recommended next steps include:
-- Deeper exploration of the most promising themes
-- Practical testing of the synthesized framework
-- Integration with existing knowledge bases
-- Initiation of a new cycle focusing on emergent questions
-"""
+        for phase in cycle["phases"]:
+            phase_type = phase["type"]
+            results = phase.get("results")
+            
+            if phase_type == "lightface":
+                if "topic" in phase:
+                    topics.append(phase["topic"])
+                if results is not None:
+                    total_exploration_nodes += results.get("nodes_created", 0)
+                    total_exploration_branches += results.get("branches_created", 0)
+            
+            elif phase_type == "darkface":
+                darkface_count += 1
+                if results is not None:
+                    total_synthesis_clusters += results.get("clusters_created", 0)
+                    total_synthesis_nodes += results.get("nodes_created", 0)
+                    avg_quality_score += results.get("quality_score", 0.0)
         
-        # Extract data for the summary
-        topics = []
-        for phase in lightface_phases:
-            if "topic" in phase:
-                topics.append(phase["topic"])
+        if darkface_count:
+            avg_quality_score /= darkface_count
         
         topics_text = ", ".join(topics) if topics else "various domains"
         
@@ -463,31 +893,6 @@ Based on the results of this cycle, recommended next steps include:
         start_date = cycle.get("start_time", "").split("T")[0]
         end_date = cycle.get("completion_time", "").split("T")[0]
         
-        # Get exploration stats
-        total_exploration_nodes = 0
-        total_exploration_branches = 0
-        
-        for phase in lightface_phases:
-            if "results" in phase:
-                results = phase["results"]
-                total_exploration_nodes += results.get("nodes_created", 0)
-                total_exploration_branches += results.get("branches_created", 0)
-        
-        # Get synthesis stats
-        total_synthesis_clusters = 0
-        total_synthesis_nodes = 0
-        avg_quality_score = 0.0
-        
-        for phase in darkface_phases:
-            if "results" in phase:
-                results = phase["results"]
-                total_synthesis_clusters += results.get("clusters_created", 0)
-                total_synthesis_nodes += results.get("nodes_created", 0)
-                avg_quality_score += results.get("quality_score", 0.0)
-        
-        if darkface_phases:
-            avg_quality_score /= len(darkface_phases)
-        
         # Quality text based on score
         if avg_quality_score >= 0.9:
             quality_text = "excellent"
@@ -501,7 +906,7 @@ Based on the results of this cycle, recommended next steps include:
             quality_text = "moderate"
         
         # Fill in the template
-        summary = template.format(
+        summary = _render_summary(
             name=cycle.get("name", "Unnamed"),
             topics=topics_text,
             start_date=start_date,
@@ -539,28 +944,8 @@ def main():
     
     # Create a default config if it doesn't exist
     if not os.path.exists(args.config):
-        default_config = {
-            "name": "Default Toroidal Grammar Policy",
-            "description": "Default policy for balancing exploration and synthesis",
-            "version": "1.0.0",
-            "default_cycle_name": "Toroidal Cycle",
-            "lightface": {
-                "topic": "cognitive architecture",
-                "duration": 2,
-                "constraints": []
-            },
-            "darkface": {
-                "title": "Synthesis Session",
-                "criteria": []
-            },
-            "cycle": {
-                "auto_advance": False,
-                "phases": ["lightface", "darkface"]
-            }
-        }
-        
-        with open(args.config, 'w') as f:
-            yaml.dump(default_config, f, default_flow_style=False)
+        with open(args.config, 'wb') as f:
+            f.write(_DEFAULT_CONFIG_YAML)
         
         print(f"Created default configuration: {args.config}")
     
@@ -568,21 +953,29 @@ def main():
     
     if args.list:
         cycles = cycle_manager.list_cycles(args.status)
-        print(f"\nToroidal Cycles ({len(cycles)}):")
+        
+        # Build the listing and write it in one go
+        lines = [f"\nToroidal Cycles ({len(cycles)}):"]
         
         for i, cycle in enumerate(cycles):
-            print(f"\n{i+1}. {cycle['id']}")
-            print(f"   Name: {cycle['name']}")
-            print(f"   Status: {cycle['status'].upper()}")
-            print(f"   Started: {cycle['start_time'].split('T')[0]}")
-            print(f"   Phases: {len(cycle['phases'])}")
-            print(f"   Current: {cycle['current_phase']}")
+            lines.append(
+                f"\n{i+1}. {cycle['id']}\n"
+                f"   Name: {cycle['name']}\n"
+                f"   Status: {cycle['status'].upper()}\n"
+                f"   Started: {cycle['start_time'].split('T')[0]}\n"
+                f"   Phases: {len(cycle['phases'])}\n"
+                f"   Current: {cycle['current_phase']}"
+            )
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     elif args.simulate:
         cycle = cycle_manager.simulate_cycle(args.name)
-        print(f"\nSimulated cycle: {cycle['id']}")
-        print(f"Completed {len(cycle['phases'])} phases")
-        print(f"Summary length: {len(cycle.get('summary', ''))}")
+        sys.stdout.write(
+            f"\nSimulated cycle: {cycle['id']}\n"
+            f"Completed {len(cycle['phases'])} phases\n"
+            f"Summary length: {len(cycle.get('summary', ''))}\n"
+        )
     
     elif args.start:
         cycle_manager.start_cycle(args.name)
@@ -8,20 +8,121 @@ import os
 import sys
 import json
 import argparse
+import hashlib
 import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Set
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Threads used to read session files in list_syntheses
+LIST_READ_WORKERS = 8
+
+def _dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize obj as JSON, compact unless pretty, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def _loads(data: bytes) -> Any:
+    """Parse a JSON document, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _encode_session(session: Dict[str, Any], path: str) -> bytes:
+    """Serialize a session in the format implied by its file extension."""
+    if path.endswith(".mp"):
+        import msgpack
+        return msgpack.packb(session, use_bin_type=True)
+    return _dumps(session)
+
+def _read_session(path: str) -> Dict[str, Any]:
+    """Read and parse a session file in the format implied by its extension."""
+    data = Path(path).read_bytes()
+    if path.endswith(".mp"):
+        import msgpack
+        return msgpack.unpackb(data, raw=False)
+    return _loads(data)
+
+def _load_json(path: str) -> Any:
+    """Read and parse a JSON file in one call."""
+    return _loads(Path(path).read_bytes())
+
+def _dump_json(obj: Any, path: str) -> None:
+    """Serialize obj to an indented JSON file with a single write."""
+    data = _dumps(obj, pretty=True)
+    with open(path, 'wb') as f:
+        f.write(data)
 
 class DarkFaceSynthesis:
-    def __init__(self, output_dir: str = "governance/syntheses"):
+    # Directories already created or confirmed by any instance in this process
+    _ensured_dirs: Set[str] = set()
+    
+    def __init__(self, output_dir: str = "governance/syntheses", seed: Optional[int] = None):
         """
         Initialize the DarkFace synthesis manager.
         
         Args:
             output_dir: Directory to store synthesis results
+            seed: Seed for the simulated clustering and synthesis text, for
+                reproducible runs (e.g. in tests)
         """
         self.output_dir = output_dir
-        os.makedirs(output_dir, exist_ok=True)
+        self._ensure_dir(output_dir)
+        
+        # Sessions are stored as MessagePack (.mp) instead of JSON when
+        # DARKFACE_BINARY is set; fail now rather than on the first save if
+        # msgpack is missing
+        if os.environ.get("DARKFACE_BINARY"):
+            import msgpack
+            self._session_ext = ".mp"
+        else:
+            self._session_ext = ".json"
+        
+        # Random source for the simulated clustering and synthesis text
+        self._rng = random.Random(seed)
+    
+    def _ensure_dir(self, path: str) -> None:
+        """Create path if needed, skipping the syscall for directories seen before."""
+        if path in self._ensured_dirs:
+            return
+        os.makedirs(path, exist_ok=True)
+        self._ensured_dirs.add(path)
+    
+    def _session_path(self, session_id: str) -> str:
+        """Path of a synthesis session file in this instance's storage format."""
+        return os.path.join(self.output_dir, f"{session_id}{self._session_ext}")
+    
+    def _load_session(self, session_id: str, session_file: str) -> Dict[str, Any]:
+        """
+        Load a synthesis session from disk.
+        
+        Args:
+            session_id: The synthesis session ID
+            session_file: Path to the session file
+            
+        Returns:
+            The session, freshly parsed and owned by the caller
+        """
+        try:
+            return _read_session(session_file)
+        except FileNotFoundError:
+            raise ValueError(f"Synthesis session not found: {session_id}")
+    
+    def _save_session(self, session_file: str, session: Dict[str, Any]) -> None:
+        """Write a synthesis session."""
+        data = _encode_session(session, session_file)
+        with open(session_file, 'wb') as f:
+            f.write(data)
     
     def start_synthesis(self, exploration_id: str, title: str,
                        criteria: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
@@ -36,37 +137,19 @@ class DarkFaceSynthesis:
         Returns:
             Synthesis session metadata
         """
-        # Check if the exploration exists
+        # Load the exploration
         exploration_file = os.path.join("governance/explorations", f"{exploration_id}.json")
-        if not os.path.exists(exploration_file):
+        try:
+            exploration = _load_json(exploration_file)
+        except FileNotFoundError:
             raise ValueError(f"Exploration session not found: {exploration_id}")
         
-        # Load the exploration
-        with open(exploration_file, 'r') as f:
-            exploration = json.load(f)
-        
-        # Generate a session ID
-        session_id = f"synth_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        
-        # Initialize the synthesis session
-        session = {
-            "id": session_id,
-            "title": title,
-            "exploration_id": exploration_id,
-            "exploration_topic": exploration.get("topic", "unknown"),
-            "start_time": datetime.now().isoformat(),
-            "status": "active",
-            "criteria": criteria or [],
-            "nodes": [],
-            "clusters": [],
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat()
-        }
+        session = self._new_session(exploration_id, exploration, title, criteria)
+        session_id = session["id"]
         
         # Save the session metadata
-        session_file = os.path.join(self.output_dir, f"{session_id}.json")
-        with open(session_file, 'w') as f:
-            json.dump(session, f, indent=2)
+        session_file = self._session_path(session_id)
+        self._save_session(session_file, session)
         
         print(f"DarkFace synthesis session started: {session_id}")
         print(f"Title: {title}")
@@ -88,45 +171,24 @@ class DarkFaceSynthesis:
             The updated session with clusters
         """
         # Load the synthesis session
-        session_file = os.path.join(self.output_dir, f"{session_id}.json")
-        if not os.path.exists(session_file):
-            raise ValueError(f"Synthesis session not found: {session_id}")
-        
-        with open(session_file, 'r') as f:
-            session = json.load(f)
+        session_file = self._session_path(session_id)
+        session = self._load_session(session_id, session_file)
         
         # Load the exploration session
         exploration_file = os.path.join("governance/explorations", f"{session['exploration_id']}.json")
-        if not os.path.exists(exploration_file):
+        try:
+            exploration = _load_json(exploration_file)
+        except FileNotFoundError:
             raise ValueError(f"Exploration session not found: {session['exploration_id']}")
         
-        with open(exploration_file, 'r') as f:
-            exploration = json.load(f)
-        
-        # Get the nodes from the exploration
-        exploration_nodes = exploration.get("nodes", [])
-        if not exploration_nodes:
-            raise ValueError(f"Exploration session has no nodes: {session['exploration_id']}")
-        
-        # Cluster the nodes
-        if method == "tag_similarity":
-            clusters = self._cluster_by_tags(exploration_nodes, num_clusters)
-        elif method == "content_similarity":
-            clusters = self._cluster_by_content(exploration_nodes, num_clusters)
-        else:
-            raise ValueError(f"Unknown clustering method: {method}")
-        
-        # Update the session
-        session["clusters"] = clusters
-        session["updated_at"] = datetime.now().isoformat()
+        self._apply_clusters(session, exploration, method, num_clusters)
         
         # Save the updated session
-        with open(session_file, 'w') as f:
-            json.dump(session, f, indent=2)
+        self._save_session(session_file, session)
         
         print(f"Clustered nodes for synthesis: {session_id}")
         print(f"Method: {method}")
-        print(f"Number of clusters: {len(clusters)}")
+        print(f"Number of clusters: {len(session['clusters'])}")
         
         return session
     
@@ -147,37 +209,15 @@ class DarkFaceSynthesis:
             The created node
         """
         # Load the synthesis session
-        session_file = os.path.join(self.output_dir, f"{session_id}.json")
-        if not os.path.exists(session_file):
-            raise ValueError(f"Synthesis session not found: {session_id}")
+        session_file = self._session_path(session_id)
+        session = self._load_session(session_id, session_file)
         
-        with open(session_file, 'r') as f:
-            session = json.load(f)
-        
-        # Generate a node ID
-        node_id = f"synth_node_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{len(session['nodes'])}"
-        
-        # Create the node
-        node = {
-            "id": node_id,
-            "title": title,
-            "content": content,
-            "cluster_id": cluster_id,
-            "source_node_ids": source_node_ids or [],
-            "created_at": datetime.now().isoformat()
-        }
-        
-        # Add the node to the session
-        session["nodes"].append(node)
-        
-        # Update the session
-        session["updated_at"] = datetime.now().isoformat()
+        node = self._append_node(session, title, content, cluster_id, source_node_ids)
         
         # Save the updated session
-        with open(session_file, 'w') as f:
-            json.dump(session, f, indent=2)
+        self._save_session(session_file, session)
         
-        print(f"Added synthesis node: {node_id}")
+        print(f"Added synthesis node: {node['id']}")
         print(f"Title: {title}")
         if cluster_id:
             print(f"Cluster: {cluster_id}")
@@ -198,23 +238,13 @@ class DarkFaceSynthesis:
             The updated session
         """
         # Load the synthesis session
-        session_file = os.path.join(self.output_dir, f"{session_id}.json")
-        if not os.path.exists(session_file):
-            raise ValueError(f"Synthesis session not found: {session_id}")
-        
-        with open(session_file, 'r') as f:
-            session = json.load(f)
+        session_file = self._session_path(session_id)
+        session = self._load_session(session_id, session_file)
         
-        # Update the session
-        session["status"] = "completed"
-        session["summary"] = summary
-        session["quality_score"] = max(0.0, min(1.0, quality_score))
-        session["completion_time"] = datetime.now().isoformat()
-        session["updated_at"] = datetime.now().isoformat()
+        self._apply_finalize(session, summary, quality_score)
         
         # Save the updated session
-        with open(session_file, 'w') as f:
-            json.dump(session, f, indent=2)
+        self._save_session(session_file, session)
         
         print(f"Synthesis session finalized: {session_id}")
         print(f"Quality score: {quality_score}")
@@ -226,6 +256,68 @@ class DarkFaceSynthesis:
         
         return session
     
+    def _new_session(self, exploration_id: str, exploration: Dict[str, Any], title: str,
+                     criteria: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Build a new, unsaved synthesis session for an exploration."""
+        now = datetime.now()
+        now_iso = now.isoformat()
+        return {
+            "id": f"synth_{now.strftime('%Y%m%d_%H%M%S')}",
+            "title": title,
+            "exploration_id": exploration_id,
+            "exploration_topic": exploration.get("topic", "unknown"),
+            "start_time": now_iso,
+            "status": "active",
+            "criteria": criteria or [],
+            "nodes": [],
+            "clusters": [],
+            "created_at": now_iso,
+            "updated_at": now_iso
+        }
+    
+    def _apply_clusters(self, session: Dict[str, Any], exploration: Dict[str, Any],
+                        method: str, num_clusters: int) -> None:
+        """Cluster the exploration's nodes into the in-memory session."""
+        exploration_nodes = exploration.get("nodes", [])
+        if not exploration_nodes:
+            raise ValueError(f"Exploration session has no nodes: {session['exploration_id']}")
+        
+        if method == "tag_similarity":
+            clusters = self._cluster_by_tags(exploration_nodes, num_clusters)
+        elif method == "content_similarity":
+            clusters = self._cluster_by_content(exploration_nodes, num_clusters)
+        else:
+            raise ValueError(f"Unknown clustering method: {method}")
+        
+        session["clusters"] = clusters
+        session["updated_at"] = datetime.now().isoformat()
+    
+    def _append_node(self, session: Dict[str, Any], title: str, content: str,
+                     cluster_id: Optional[str] = None,
+                     source_node_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Add a synthesis node to the in-memory session and return it."""
+        now_iso = datetime.now().isoformat()
+        node = {
+            "id": f"synth_node_{time.time_ns()}_{len(session['nodes'])}",
+            "title": title,
+            "content": content,
+            "cluster_id": cluster_id,
+            "source_node_ids": source_node_ids or [],
+            "created_at": now_iso
+        }
+        session["nodes"].append(node)
+        session["updated_at"] = now_iso
+        return node
+    
+    def _apply_finalize(self, session: Dict[str, Any], summary: str, quality_score: float) -> None:
+        """Mark the in-memory session completed with its summary and score."""
+        session["status"] = "completed"
+        session["summary"] = summary
+        session["quality_score"] = max(0.0, min(1.0, quality_score))
+        now_iso = datetime.now().isoformat()
+        session["completion_time"] = now_iso
+        session["updated_at"] = now_iso
+    
     def list_syntheses(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         List synthesis sessions.
@@ -236,28 +328,34 @@ class DarkFaceSynthesis:
         Returns:
             List of synthesis sessions
         """
-        sessions = []
-        
-        for file in os.listdir(self.output_dir):
-            if file.startswith("synth_") and file.endswith(".json"):
-                file_path = os.path.join(self.output_dir, file)
-                
-                try:
-                    with open(file_path, 'r') as f:
-                        session = json.load(f)
-                    
-                    # Apply status filter if provided
-                    if status is None or session.get("status") == status:
-                        sessions.append(session)
-                
-                except Exception as e:
-                    print(f"Error reading session file {file}: {e}")
+        with os.scandir(self.output_dir) as it:
+            entries = [entry for entry in it
+                       if entry.name.startswith("synth_") and entry.name.endswith((".json", ".mp"))
+                       and entry.is_file(follow_symlinks=False)]
+        
+        # Read and parse the files concurrently so their I/O overlaps
+        with ThreadPoolExecutor(max_workers=LIST_READ_WORKERS) as pool:
+            loaded = list(pool.map(self._read_session_file, entries))
+        
+        # Apply status filter if provided
+        sessions = [session for session in loaded
+                    if session is not None and (status is None or session.get("status") == status)]
         
         # Sort by start time (newest first)
         sessions.sort(key=lambda x: x.get("start_time", ""), reverse=True)
         
         return sessions
     
+    def _read_session_file(self, entry: os.DirEntry) -> Optional[Dict[str, Any]]:
+        """Read and parse a session file, returning None if it can't be loaded."""
+        # Decode errors from json, orjson and msgpack all derive from ValueError;
+        # ImportError covers .mp files when msgpack isn't installed
+        try:
+            return _read_session(entry.path)
+        except (OSError, ValueError, ImportError) as e:
+            print(f"Error reading session file {entry.name}: {e}")
+            return None
+    
     def simulate_synthesis(self, exploration_id: str) -> Dict[str, Any]:
         """
         Simulate a synthesis session for demo purposes.
@@ -268,26 +366,27 @@ class DarkFaceSynthesis:
         Returns:
             The simulated session
         """
-        # Check if the exploration exists
+        # Load the exploration if it exists
         exploration_file = os.path.join("governance/explorations", f"{exploration_id}.json")
-        if not os.path.exists(exploration_file):
+        try:
+            exploration = _load_json(exploration_file)
+        except FileNotFoundError:
             # Create a simulated exploration first
             from lightface import LightFaceExploration
             exploration_manager = LightFaceExploration("governance/explorations")
             exploration = exploration_manager.simulate_exploration("cognitive architecture", 2, 15)
             exploration_id = exploration["id"]
-        else:
-            # Load the exploration
-            with open(exploration_file, 'r') as f:
-                exploration = json.load(f)
         
-        # Start the synthesis
+        # Build the whole session in memory and write it once at the end
         title = f"Synthesis of {exploration.get('topic', 'exploration')}"
-        session = self.start_synthesis(exploration_id, title)
+        session = self._new_session(exploration_id, exploration, title)
         session_id = session["id"]
         
         # Cluster the nodes
-        session = self.cluster_nodes(session_id, "tag_similarity", 3)
+        self._apply_clusters(session, exploration, "tag_similarity", 3)
+        
+        # Clusters only reference exploration nodes by ID
+        exploration_nodes_by_id = {node["id"]: node for node in exploration.get("nodes", [])}
         
         # Create synthesis nodes for each cluster
         for i, cluster in enumerate(session["clusters"]):
@@ -295,26 +394,32 @@ class DarkFaceSynthesis:
             cluster_title = f"Synthesis of cluster {i+1}: {cluster['name']}"
             
             # Get source node IDs from the cluster
-            source_node_ids = [node["id"] for node in cluster["nodes"]]
+            source_node_ids = list(cluster["node_ids"])
             
             # Generate content
-            content = self._generate_synthesis_content(cluster["nodes"])
+            content = self._generate_synthesis_content(
+                self._resolve_cluster_nodes(cluster, exploration_nodes_by_id))
             
-            self.add_synthesis_node(session_id, cluster_title, content, cluster_id, source_node_ids)
+            self._append_node(session, cluster_title, content, cluster_id, source_node_ids)
         
         # Create an overall synthesis
         overall_title = "Overall synthesis"
         overall_content = self._generate_overall_synthesis(session["clusters"])
-        self.add_synthesis_node(session_id, overall_title, overall_content)
+        self._append_node(session, overall_title, overall_content)
         
         # Finalize the synthesis
         summary = f"This synthesis of {exploration.get('topic', 'exploration')} identified {len(session['clusters'])} main themes and integrated them into a coherent framework."
-        quality_score = random.uniform(0.7, 0.95)
-        self.finalize_synthesis(session_id, summary, quality_score)
+        quality_score = self._rng.uniform(0.7, 0.95)
+        self._apply_finalize(session, summary, quality_score)
         
-        # Reload the full session
-        with open(os.path.join(self.output_dir, f"{session_id}.json"), 'r') as f:
-            session = json.load(f)
+        session_file = self._session_path(session_id)
+        self._save_session(session_file, session)
+        
+        print(f"Simulated synthesis session saved: {session_id}")
+        print(f"Based on exploration: {exploration_id} ({exploration.get('topic', 'unknown')})")
+        
+        if quality_score >= 0.7:
+            self._create_memory_atom(session)
         
         return session
     
@@ -330,13 +435,14 @@ class DarkFaceSynthesis:
                 all_tags.update(node["tags"])
         
         # Select random seed tags for clusters
-        if len(all_tags) >= num_clusters:
-            seed_tags = random.sample(list(all_tags), num_clusters)
+        all_tags_list = list(all_tags)
+        if len(all_tags_list) >= num_clusters:
+            seed_tags = self._rng.sample(all_tags_list, num_clusters)
         else:
-            seed_tags = list(all_tags)
+            seed_tags = list(all_tags_list)
             # If not enough tags, duplicate some
             while len(seed_tags) < num_clusters:
-                seed_tags.append(random.choice(list(all_tags)))
+                seed_tags.append(self._rng.choice(all_tags_list))
         
         # Initialize clusters
         clusters = []
@@ -348,30 +454,21 @@ class DarkFaceSynthesis:
                 "nodes": []
             })
         
+        # Map each seed tag to the first cluster it seeds
+        seed_index = {}
+        for i, tag in enumerate(seed_tags):
+            seed_index.setdefault(tag, i)
+        
         # Assign nodes to clusters
         for node in nodes:
-            node_tags = node.get("tags", [])
-            
-            # Find the best cluster match
-            best_cluster = None
-            best_overlap = -1
-            
-            for cluster in clusters:
-                seed_tag = cluster["seed_tag"]
-                if seed_tag in node_tags:
-                    # Direct match with seed tag
-                    overlap = 1
-                else:
-                    # No direct match, count other tag overlaps
-                    overlap = 0
-                
-                if overlap > best_overlap:
-                    best_overlap = overlap
-                    best_cluster = cluster
+            # Find the earliest cluster seeded by one of the node's tags
+            hits = [seed_index[tag] for tag in node.get("tags", ()) if tag in seed_index]
             
             # If no good match, assign to a random cluster
-            if best_cluster is None:
-                best_cluster = random.choice(clusters)
+            if hits:
+                best_cluster = clusters[min(hits)]
+            else:
+                best_cluster = self._rng.choice(clusters)
             
             # Add to the cluster
             best_cluster["nodes"].append(node)
@@ -382,11 +479,11 @@ class DarkFaceSynthesis:
             
             # If a cluster is empty, assign a random node to it
             if cluster["node_count"] == 0 and nodes:
-                random_node = random.choice(nodes)
+                random_node = self._rng.choice(nodes)
                 cluster["nodes"].append(random_node)
                 cluster["node_count"] = 1
         
-        return clusters
+        return self._compact_clusters(clusters)
     
     def _cluster_by_content(self, nodes: List[Dict[str, Any]], num_clusters: int) -> List[Dict[str, Any]]:
         """Cluster nodes by content similarity."""
@@ -395,44 +492,79 @@ class DarkFaceSynthesis:
         
         # Initialize clusters with random seed nodes
         if len(nodes) >= num_clusters:
-            seed_nodes = random.sample(nodes, num_clusters)
+            seed_nodes = self._rng.sample(nodes, num_clusters)
         else:
-            seed_nodes = nodes
+            seed_nodes = list(nodes)
             # If not enough nodes, duplicate some
             while len(seed_nodes) < num_clusters:
-                seed_nodes.append(random.choice(nodes))
+                seed_nodes.append(self._rng.choice(nodes))
         
         clusters = []
         for i, seed_node in enumerate(seed_nodes):
             clusters.append({
                 "id": f"cluster_{i+1}",
                 "name": f"Theme: {seed_node.get('title', f'Cluster {i+1}')}",
-                "seed_node": seed_node,
+                "seed_node_id": seed_node["id"],
                 "nodes": [seed_node]
             })
         
-        # Assign remaining nodes to clusters
-        remaining_nodes = [node for node in nodes if node not in seed_nodes]
+        # Tokenize each seed once rather than per comparison
+        seed_tokens = [self._content_tokens(seed_node) for seed_node in seed_nodes]
+        
+        # Assign remaining nodes to the cluster whose seed shares the most words
+        seed_ids = {id(seed_node) for seed_node in seed_nodes}
+        remaining_nodes = [node for node in nodes if id(node) not in seed_ids]
         for node in remaining_nodes:
-            # Randomly assign for the simulation
-            cluster = random.choice(clusters)
-            cluster["nodes"].append(node)
+            tokens = self._content_tokens(node)
+            
+            best_cluster = None
+            best_score = 0.0
+            for cluster, seed in zip(clusters, seed_tokens):
+                union = len(tokens | seed)
+                score = len(tokens & seed) / union if union else 0.0
+                if score > best_score:
+                    best_score = score
+                    best_cluster = cluster
+            
+            # No words in common with any seed, assign randomly
+            if best_cluster is None:
+                best_cluster = self._rng.choice(clusters)
+            
+            best_cluster["nodes"].append(node)
         
         # Update cluster statistics
         for cluster in clusters:
             cluster["node_count"] = len(cluster["nodes"])
         
+        return self._compact_clusters(clusters)
+    
+    def _compact_clusters(self, clusters: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Replace each cluster's node dicts with their IDs before the session is saved."""
+        for cluster in clusters:
+            cluster["node_ids"] = [node["id"] for node in cluster.pop("nodes")]
         return clusters
     
+    def _resolve_cluster_nodes(self, cluster: Dict[str, Any],
+                               exploration_nodes_by_id: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Look up the exploration nodes referenced by a cluster, skipping unknown IDs."""
+        return [exploration_nodes_by_id[node_id] for node_id in cluster.get("node_ids", [])
+                if node_id in exploration_nodes_by_id]
+    
+    def _content_tokens(self, node: Dict[str, Any]) -> frozenset:
+        """Lower-cased words of a node's title and content."""
+        text = f"{node.get('title', '')} {node.get('content', '')}"
+        return frozenset(text.lower().split())
+    
     def _generate_synthesis_content(self, nodes: List[Dict[str, Any]]) -> str:
         """Generate synthesis content from a cluster of nodes."""
-        # Extract concepts from nodes
-        concepts = []
+        # Extract up to five distinct, non-empty concepts from the node titles
+        unique_concepts = []
         for node in nodes:
-            concepts.append(node.get("title", ""))
-        
-        # Remove duplicates and limit
-        unique_concepts = list(set(concepts))[:5]
+            concept = node.get("title", "")
+            if concept and concept not in unique_concepts:
+                unique_concepts.append(concept)
+                if len(unique_concepts) == 5:
+                    break
         
         # Generate a synthesized paragraph
         synthesis_templates = [
@@ -445,7 +577,7 @@ class DarkFaceSynthesis:
             "Examining this cluster reveals patterns connecting {concepts} in unexpected ways. These connections suggest underlying principles that may have broader applicability. By synthesizing these diverse elements, we gain a more nuanced understanding of the complex relationships involved."
         ]
         
-        template = random.choice(synthesis_templates)
+        template = self._rng.choice(synthesis_templates)
         concepts_text = ", ".join(unique_concepts)
         
         return template.format(concepts=concepts_text)
@@ -465,17 +597,17 @@ The most significant insight from this synthesis is the emergence of patterns th
 
 This synthesis provides both a comprehensive overview of the current conceptual landscape and identifies promising directions for further exploration."""
         
+        # Pick a random focus area for each cluster
+        focus_areas = ["theoretical foundations", "practical applications", 
+                      "methodological approaches", "conceptual frameworks",
+                      "integration patterns", "emergent properties"]
+        focus_picks = self._rng.choices(focus_areas, k=len(cluster_names))
+        
         # Generate details for each cluster
-        cluster_details = ""
-        for i, name in enumerate(cluster_names):
-            cluster_details += f"{i+1}. **{name}** - Represents a distinct perspective focusing on "
-            
-            # Add some random focus areas
-            focus_areas = ["theoretical foundations", "practical applications", 
-                          "methodological approaches", "conceptual frameworks",
-                          "integration patterns", "emergent properties"]
-            
-            cluster_details += f"{random.choice(focus_areas)}.\n\n"
+        parts = []
+        for i, (name, focus) in enumerate(zip(cluster_names, focus_picks)):
+            parts.append(f"{i+1}. **{name}** - Represents a distinct perspective focusing on {focus}.\n\n")
+        cluster_details = "".join(parts)
         
         return synthesis_template.format(topic="the domain", cluster_details=cluster_details)
     
@@ -484,18 +616,20 @@ This synthesis provides both a comprehensive overview of the current conceptual
         # In a real implementation, this would create a proper memory atom
         # For now, we'll just print what would happen
         memory_dir = "memory/atoms"
-        os.makedirs(memory_dir, exist_ok=True)
+        self._ensure_dir(memory_dir)
         
         # Create a simplified memory atom
+        now = datetime.now()
+        content = session.get("summary", "Synthesis results")
         atom = {
-            "id": f"semantic/{datetime.now().strftime('%Y-%m-%d')}_{session['id']}",
+            "id": f"semantic/{now.strftime('%Y-%m-%d')}_{session['id']}",
             "type": "semantic",
             "tags": ["synthesis", "toroidal-grammar", "darkface"],
             "actors": ["DarkFace Synthesizer"],
             "source": "synthesis_session",
-            "created_at": datetime.now().isoformat(),
-            "content": session.get("summary", "Synthesis results"),
-            "content_hash": f"sha256:{'0'*64}",  # Placeholder
+            "created_at": now.isoformat(),
+            "content": content,
+            "content_hash": f"sha256:{hashlib.sha256(content.encode()).hexdigest()}",
             "links": [
                 {
                     "relation": "derives-from",
@@ -506,8 +640,7 @@ This synthesis provides both a comprehensive overview of the current conceptual
         
         # Write to a file
         output_file = os.path.join(memory_dir, f"synthesis_{session['id']}.json")
-        with open(output_file, 'w') as f:
-            json.dump(atom, f, indent=2)
+        _dump_json(atom, output_file)
         
         print(f"Created memory atom: {atom['id']}")
         print(f"Saved to: {output_file}")
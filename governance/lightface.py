@@ -8,9 +8,66 @@ import os
 import sys
 import json
 import argparse
+import atexit
+import contextlib
+import copy
 import random
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+def _dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize obj as JSON, compact unless pretty, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def _dumps_line(obj: Any) -> bytes:
+    """Serialize obj as one line of compact JSON, newline included."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8') + b'\n'
+
+def _loads(data: bytes) -> Any:
+    """Parse a JSON document, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dump_json(obj: Any, path: str) -> None:
+    """Serialize obj to an indented JSON file with a single write."""
+    data = _dumps(obj, pretty=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+# General tags mixed into every generated node's tags
+_GENERAL_TAGS = (
+    "exploration", "cognitive", "research", "theory", "application",
+    "framework", "model", "system", "architecture", "integration"
+)
+
+def _index_entry(session: Dict[str, Any]) -> Dict[str, Any]:
+    """The summary of a session kept in the exploration index."""
+    return {
+        "id": session["id"],
+        "topic": session.get("topic", "unknown"),
+        "status": session["status"],
+        "start_time": session["start_time"],
+        "end_time": session["end_time"],
+        "node_count": len(session.get("nodes", [])),
+        "branch_count": len(session.get("branches", []))
+    }
 
 class LightFaceExploration:
     def __init__(self, output_dir: str = "governance/explorations"):
@@ -22,6 +79,142 @@ class LightFaceExploration:
         """
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
+        
+        # Sessions with deferred changes not yet written to disk, by ID. Every
+        # other session is read from disk on each call, so the dicts returned
+        # by the public methods always belong to the caller.
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._flush_registered = False
+        
+        # Summaries of every session, one JSON object per line; later lines
+        # for the same session supersede earlier ones
+        self._index_file = os.path.join(output_dir, "_index.jsonl")
+        self._index_lock_file = os.path.join(output_dir, "_index.lock")
+    
+    def _session_file(self, session_id: str) -> str:
+        """Path of an exploration session file."""
+        return os.path.join(self.output_dir, f"{session_id}.json")
+    
+    def _load_session(self, session_id: str) -> Dict[str, Any]:
+        """
+        Load a session, preferring its pending in-memory copy over the file.
+        
+        Args:
+            session_id: The exploration session ID
+        
+        Returns:
+            The session. A pending session is the in-memory copy itself, so
+            it must not be returned to callers.
+        """
+        session = self._pending.get(session_id)
+        if session is not None:
+            return session
+        
+        try:
+            with open(self._session_file(session_id), 'rb') as f:
+                return _loads(f.read())
+        except FileNotFoundError:
+            raise ValueError(f"Exploration session not found: {session_id}")
+    
+    def _store_session(self, session: Dict[str, Any], flush: bool = True) -> None:
+        """Write a session now, or keep it in memory until the next flush."""
+        session_id = session["id"]
+        if flush:
+            self._pending.pop(session_id, None)
+            self._write_session(session)
+            return
+        
+        self._pending[session_id] = session
+        if not self._flush_registered:
+            # Deferred changes must not be lost if the caller never flushes
+            atexit.register(self.flush_all)
+            self._flush_registered = True
+    
+    def _write_session(self, session: Dict[str, Any]) -> None:
+        """Write a session file and record its summary in the index."""
+        _dump_json(session, self._session_file(session["id"]))
+        self._append_index(session)
+    
+    def flush_all(self) -> None:
+        """Write every session with deferred changes to disk."""
+        for session_id in list(self._pending):
+            self._write_session(self._pending[session_id])
+            del self._pending[session_id]
+    
+    @contextlib.contextmanager
+    def _index_lock(self, exclusive: bool = False):
+        """
+        Hold the index lock while the block runs.
+        
+        Appends share the lock with each other; compaction takes it
+        exclusively so no append lands in the file it is replacing. Without
+        fcntl (e.g. on Windows) no lock is taken.
+        
+        Args:
+            exclusive: Take the lock exclusively
+        """
+        if fcntl is None:
+            yield
+            return
+        
+        with open(self._index_lock_file, 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+    
+    def _append_index(self, session: Dict[str, Any]) -> None:
+        """Record a session's current summary in the index."""
+        with self._index_lock():
+            with open(self._index_file, 'ab') as f:
+                f.write(_dumps_line(_index_entry(session)))
+    
+    def _read_index(self) -> Tuple[Dict[str, Dict[str, Any]], int]:
+        """
+        Read the index, keeping the latest summary of each session.
+        
+        Returns:
+            The summaries by session ID and the number of lines read
+        """
+        try:
+            with open(self._index_file, 'rb') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return {}, 0
+        
+        index = {}
+        for line in lines:
+            try:
+                entry = _loads(line)
+            except ValueError:
+                # Blank or partially written line
+                continue
+            index[entry["id"]] = entry
+        
+        return index, len(lines)
+    
+    def _write_index(self, index: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Replace the index with one line per session.
+        
+        The index is re-read under the lock first, so summaries appended by
+        other processes since index was read are kept rather than lost.
+        
+        Args:
+            index: Summaries by session ID, as read and updated by the caller
+        """
+        with self._index_lock(exclusive=True):
+            current, _ = self._read_index()
+            for session_id, entry in index.items():
+                current.setdefault(session_id, entry)
+            
+            # Drop sessions the caller removed, keeping ones created since
+            for session_id in current.keys() - index.keys():
+                if not os.path.exists(self._session_file(session_id)):
+                    del current[session_id]
+            
+            tmp_file = f"{self._index_file}.{os.getpid()}.tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(b"".join(_dumps_line(entry) for entry in current.values()))
+            os.replace(tmp_file, self._index_file)
     
     def start_exploration(self, topic: str, duration: int = 2, 
                         constraints: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -37,27 +230,27 @@ class LightFaceExploration:
             Exploration session metadata
         """
         # Generate a session ID
-        session_id = f"explore_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        now = datetime.now()
+        now_iso = now.isoformat()
+        session_id = f"explore_{now.strftime('%Y%m%d_%H%M%S')}"
         
         # Initialize the exploration session
         session = {
             "id": session_id,
             "topic": topic,
-            "start_time": datetime.now().isoformat(),
-            "end_time": (datetime.now() + timedelta(days=duration)).isoformat(),
+            "start_time": now_iso,
+            "end_time": (now + timedelta(days=duration)).isoformat(),
             "duration_days": duration,
             "constraints": constraints or [],
             "status": "active",
             "branches": [],
             "nodes": [],
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat()
+            "created_at": now_iso,
+            "updated_at": now_iso
         }
         
         # Save the session metadata
-        session_file = os.path.join(self.output_dir, f"{session_id}.json")
-        with open(session_file, 'w') as f:
-            json.dump(session, f, indent=2)
+        self._store_session(session)
         
         print(f"LightFace exploration session started: {session_id}")
         print(f"Topic: {topic}")
@@ -67,7 +260,8 @@ class LightFaceExploration:
         return session
     
     def add_exploration_node(self, session_id: str, title: str, content: str, 
-                           tags: List[str], parent_id: Optional[str] = None) -> Dict[str, Any]:
+                           tags: List[str], parent_id: Optional[str] = None,
+                           flush: bool = True) -> Dict[str, Any]:
         """
         Add a node to the exploration tree.
         
@@ -77,36 +271,90 @@ class LightFaceExploration:
             content: Content of the node
             tags: Tags for the node
             parent_id: Optional parent node ID
-            
+            flush: Write the session now; if False it is kept in memory and
+                written by flush_all(), or at the latest when the process exits
+        
         Returns:
             The created node
         """
         # Load the session
-        session_file = os.path.join(self.output_dir, f"{session_id}.json")
-        if not os.path.exists(session_file):
-            raise ValueError(f"Exploration session not found: {session_id}")
+        session = self._load_session(session_id)
+        now = datetime.now()
+        self._check_active(session, now)
+        
+        node = self._append_node(session, title, content, tags, parent_id, now)
+        node_id = node["id"]
+        
+        # Save the updated session
+        self._store_session(session, flush)
+        
+        print(f"Added exploration node: {node_id}")
+        print(f"Title: {title}")
+        if parent_id:
+            print(f"Branched from: {parent_id}")
+        
+        # A deferred session stays in memory, so don't hand out its node
+        return node if flush else copy.deepcopy(node)
+    
+    def add_exploration_nodes(self, session_id: str,
+                              nodes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Add several nodes to the exploration tree, loading and saving the session once.
+        
+        Args:
+            session_id: The exploration session ID
+            nodes: Nodes to add, each with "title", "content" and "tags", and
+                optionally either a "parent_id" or a "parent_index" giving the
+                position of an earlier node in the same list
+            
+        Returns:
+            The created nodes
+        """
+        # Load the session
+        session = self._load_session(session_id)
+        now = datetime.now()
+        self._check_active(session, now)
+        
+        # All nodes in the batch share one timestamp
+        created = []
+        for spec in nodes:
+            parent_id = spec.get("parent_id")
+            if "parent_index" in spec:
+                parent_id = created[spec["parent_index"]]["id"]
+            created.append(self._append_node(session, spec["title"], spec["content"],
+                                             spec["tags"], parent_id, now))
+        
+        # Save the updated session
+        self._store_session(session)
         
-        with open(session_file, 'r') as f:
-            session = json.load(f)
+        print(f"Added {len(created)} exploration nodes to {session_id}")
         
+        return created
+    
+    def _check_active(self, session: Dict[str, Any], now: datetime) -> None:
+        """Raise ValueError unless the session can still take new nodes at time now."""
         # Check if session is still active
         end_time = datetime.fromisoformat(session["end_time"])
-        if datetime.now() > end_time and session["status"] == "active":
+        if now > end_time and session["status"] == "active":
             session["status"] = "completed"
         
         if session["status"] != "active":
-            raise ValueError(f"Exploration session is not active: {session_id}")
-        
+            raise ValueError(f"Exploration session is not active: {session['id']}")
+    
+    def _append_node(self, session: Dict[str, Any], title: str, content: str,
+                     tags: List[str], parent_id: Optional[str], now: datetime) -> Dict[str, Any]:
+        """Add a node, and its branch if it has a parent, to the in-memory session."""
         # Generate a node ID
-        node_id = f"node_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{len(session['nodes'])}"
+        now_iso = now.isoformat()
+        node_id = f"node_{now.strftime('%Y%m%d_%H%M%S')}_{len(session['nodes'])}"
         
         # Create the node
         node = {
             "id": node_id,
             "title": title,
             "content": content,
-            "tags": tags,
-            "created_at": datetime.now().isoformat(),
+            "tags": list(tags),
+            "created_at": now_iso,
             "parent_id": parent_id
         }
         
@@ -118,21 +366,12 @@ class LightFaceExploration:
             branch = {
                 "from": parent_id,
                 "to": node_id,
-                "created_at": datetime.now().isoformat()
+                "created_at": now_iso
             }
             session["branches"].append(branch)
         
         # Update the session
-        session["updated_at"] = datetime.now().isoformat()
-        
-        # Save the updated session
-        with open(session_file, 'w') as f:
-            json.dump(session, f, indent=2)
-        
-        print(f"Added exploration node: {node_id}")
-        print(f"Title: {title}")
-        if parent_id:
-            print(f"Branched from: {parent_id}")
+        session["updated_at"] = now_iso
         
         return node
     
@@ -147,20 +386,15 @@ class LightFaceExploration:
             The updated session
         """
         # Load the session
-        session_file = os.path.join(self.output_dir, f"{session_id}.json")
-        if not os.path.exists(session_file):
-            raise ValueError(f"Exploration session not found: {session_id}")
-        
-        with open(session_file, 'r') as f:
-            session = json.load(f)
+        session = self._load_session(session_id)
         
         # Mark the session as completed
         session["status"] = "completed"
         session["updated_at"] = datetime.now().isoformat()
         
-        # Save the updated session
-        with open(session_file, 'w') as f:
-            json.dump(session, f, indent=2)
+        # Save the updated session, along with any other pending changes
+        self._store_session(session)
+        self.flush_all()
         
         print(f"Exploration session ended: {session_id}")
         print(f"Nodes created: {len(session['nodes'])}")
@@ -168,47 +402,85 @@ class LightFaceExploration:
         
         return session
     
-    def list_explorations(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+    def list_explorations(self, status: Optional[str] = None,
+                          full: bool = False) -> List[Dict[str, Any]]:
         """
         List exploration sessions.
         
         Args:
             status: Optional status filter
-            
+            full: Return the whole sessions instead of their summaries
+        
         Returns:
-            List of exploration sessions
+            Summaries of the exploration sessions, with their id, topic,
+            status, start_time, end_time, node_count and branch_count. With
+            full=True, the sessions themselves, including nodes and branches
         """
-        sessions = []
-        
-        for file in os.listdir(self.output_dir):
-            if file.startswith("explore_") and file.endswith(".json"):
-                file_path = os.path.join(self.output_dir, file)
+        # Make sure unsaved nodes show up in the listing
+        self.flush_all()
+        
+        index, index_lines = self._read_index()
+        now = datetime.now()
+        
+        # Only parse session files that are missing from the index
+        session_ids = set()
+        rebuild = False
+        with os.scandir(self.output_dir) as it:
+            for entry in it:
+                if not (entry.name.startswith("explore_") and entry.name.endswith(".json")
+                        and entry.is_file()):
+                    continue
                 
-                try:
-                    with open(file_path, 'r') as f:
-                        session = json.load(f)
-                    
-                    # Check if the session is active but should be marked completed
-                    if session["status"] == "active":
-                        end_time = datetime.fromisoformat(session["end_time"])
-                        if datetime.now() > end_time:
-                            session["status"] = "completed"
-                            session["updated_at"] = datetime.now().isoformat()
-                            
-                            # Save the updated session
-                            with open(file_path, 'w') as f:
-                                json.dump(session, f, indent=2)
-                    
-                    # Apply status filter if provided
-                    if status is None or session["status"] == status:
-                        sessions.append(session)
+                session_id = entry.name[:-len(".json")]
+                session_ids.add(session_id)
+                if session_id in index:
+                    continue
                 
+                try:
+                    with open(entry.path, 'rb') as f:
+                        index[session_id] = _index_entry(_loads(f.read()))
+                    rebuild = True
+                except Exception as e:
+                    print(f"Error reading session file {entry.name}: {e}")
+        
+        # Forget sessions whose files have been removed
+        for session_id in index.keys() - session_ids:
+            del index[session_id]
+            rebuild = True
+        
+        # Mark active sessions past their end time as completed
+        for entry in index.values():
+            if entry["status"] == "active" and now > datetime.fromisoformat(entry["end_time"]):
+                try:
+                    session = self._load_session(entry["id"])
+                    session["status"] = "completed"
+                    session["updated_at"] = now.isoformat()
+                    self._store_session(session)
+                    entry.update(_index_entry(session))
                 except Exception as e:
-                    print(f"Error reading session file {file}: {e}")
+                    print(f"Error updating session {entry['id']}: {e}")
+        
+        # Compact the index once superseded lines dominate it
+        if rebuild or index_lines > 2 * len(index):
+            self._write_index(index)
+        
+        # Apply status filter if provided
+        sessions = [entry for entry in index.values()
+                    if status is None or entry["status"] == status]
         
         # Sort by start time (newest first)
         sessions.sort(key=lambda x: x.get("start_time", ""), reverse=True)
         
+        if full:
+            full_sessions = []
+            for entry in sessions:
+                try:
+                    full_sessions.append(
+                        copy.deepcopy(self._load_session(entry["id"])))
+                except ValueError as e:
+                    print(f"Error loading exploration {entry['id']}: {e}")
+            return full_sessions
+        
         return sessions
     
     def simulate_exploration(self, topic: str, duration: int = 2, 
@@ -231,34 +503,34 @@ class LightFaceExploration:
         # Generate some seed topics related to the main topic
         seed_topics = self._generate_related_topics(topic, 3)
         
-        # Create root nodes for each seed topic
-        root_nodes = []
+        # Plan root nodes for each seed topic
+        planned = []
         for seed_topic in seed_topics:
-            content = self._generate_content_for_topic(seed_topic)
-            tags = self._generate_tags_for_topic(seed_topic)
-            
-            node = self.add_exploration_node(session_id, seed_topic, content, tags)
-            root_nodes.append(node)
-        
-        # Generate branching nodes
-        remaining_nodes = node_count - len(root_nodes)
+            planned.append({
+                "title": seed_topic,
+                "content": self._generate_content_for_topic(seed_topic),
+                "tags": self._generate_tags_for_topic(seed_topic)
+            })
+        
+        # Plan branching nodes
+        remaining_nodes = node_count - len(planned)
         for _ in range(remaining_nodes):
-            # Randomly select a parent node
-            parent = random.choice(session["nodes"])
-            parent_id = parent["id"]
+            # Randomly select a parent among the nodes planned so far
+            parent_index = random.randrange(len(planned))
             
             # Generate a child topic
-            child_topic = self._generate_related_topics(parent["title"], 1)[0]
-            content = self._generate_content_for_topic(child_topic)
-            tags = self._generate_tags_for_topic(child_topic)
-            
-            self.add_exploration_node(session_id, child_topic, content, tags, parent_id)
-        
-        # Reload the full session
-        with open(os.path.join(self.output_dir, f"{session_id}.json"), 'r') as f:
-            session = json.load(f)
-        
-        return session
+            child_topic = self._generate_related_topics(planned[parent_index]["title"], 1)[0]
+            planned.append({
+                "title": child_topic,
+                "content": self._generate_content_for_topic(child_topic),
+                "tags": self._generate_tags_for_topic(child_topic),
+                "parent_index": parent_index
+            })
+        
+        # Add all the nodes at once
+        self.add_exploration_nodes(session_id, planned)
+        
+        return self._load_session(session_id)
     
     def _generate_related_topics(self, topic: str, count: int) -> List[str]:
         """Generate related topics for simulation."""
@@ -295,21 +567,12 @@ class LightFaceExploration:
     
     def _generate_tags_for_topic(self, topic: str) -> List[str]:
         """Generate tags for a topic."""
-        # Extract words from the topic
-        words = topic.lower().replace('-', ' ').split()
-        
-        # Add some general tags
-        general_tags = [
-            "exploration", "cognitive", "research", "theory", "application",
-            "framework", "model", "system", "architecture", "integration"
-        ]
-        
-        # Combine specific and general tags
-        tags = words + random.sample(general_tags, min(3, len(general_tags)))
+        # Words from the topic first, then some general tags, deduplicated in order
+        tags = dict.fromkeys(topic.lower().replace('-', ' ').split())
+        tags.update(dict.fromkeys(random.sample(_GENERAL_TAGS, 3)))
         
-        # Deduplicate and limit to 5 tags
-        unique_tags = list(set(tags))
-        return unique_tags[:5]
+        # Limit to 5 tags
+        return list(tags)[:5]
 
 def main():
     parser = argparse.ArgumentParser(description="LightFace Exploration Manager")
@@ -329,15 +592,16 @@ def main():
         sessions = exploration_manager.list_explorations(args.status)
         print(f"\nExploration Sessions ({len(sessions)}):")
         
+        now = datetime.now()
         for i, session in enumerate(sessions):
             status_text = session["status"].upper()
             if status_text == "ACTIVE":
                 end_time = datetime.fromisoformat(session["end_time"])
-                days_left = (end_time - datetime.now()).days
+                days_left = (end_time - now).days
                 if days_left > 0:
                     status_text += f" ({days_left} days left)"
                 else:
-                    hours_left = (end_time - datetime.now()).total_seconds() / 3600
+                    hours_left = (end_time - now).total_seconds() / 3600
                     if hours_left > 0:
                         status_text += f" ({int(hours_left)} hours left)"
             
@@ -345,7 +609,7 @@ def main():
             print(f"   Topic: {session['topic']}")
             print(f"   Status: {status_text}")
             print(f"   Started: {session['start_time'].split('T')[0]}")
-            print(f"   Nodes: {len(session['nodes'])}")
+            print(f"   Nodes: {session['node_count']}")
     
     elif args.simulate:
         session = exploration_manager.simulate_exploration(args.topic, args.duration, args.node_count)
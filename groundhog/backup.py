@@ -8,13 +8,131 @@ import os
 import sys
 import json
 import argparse
+import contextlib
+import io
 import shutil
 import subprocess
-import tempfile
+import time
 from datetime import datetime
 import tarfile
 import gzip
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, BinaryIO
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize obj as JSON, compact unless pretty, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def _loads(data: bytes) -> Any:
+    """Parse a JSON document, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# gzip level for backup tarballs; backups favour speed over size
+COMPRESSLEVEL = 1
+
+@contextlib.contextmanager
+def _open_tarball(path: str, fileobj: Optional[BinaryIO] = None):
+    """
+    Open a gzipped tarball for writing, compressing on all cores with pigz
+    when it is installed.
+    
+    Args:
+        path: Path of the tarball to create
+        fileobj: Stream to write the tarball to instead of path
+    
+    Yields:
+        The open TarFile
+    """
+    if fileobj is not None:
+        # Streaming tarfile modes can't set a compression level, so gzip separately
+        with gzip.GzipFile(fileobj=fileobj, mode='wb', compresslevel=COMPRESSLEVEL) as gz:
+            with tarfile.open(fileobj=gz, mode="w|", dereference=True) as tar:
+                yield tar
+        return
+    
+    pigz = shutil.which("pigz")
+    if pigz is None:
+        with tarfile.open(path, "w:gz", compresslevel=COMPRESSLEVEL, dereference=True) as tar:
+            yield tar
+        return
+    
+    with open(path, 'wb') as out:
+        proc = subprocess.Popen([pigz, f"-{COMPRESSLEVEL}"], stdin=subprocess.PIPE, stdout=out)
+        try:
+            with tarfile.open(fileobj=proc.stdin, mode="w|", dereference=True) as tar:
+                yield tar
+        finally:
+            proc.stdin.close()
+            returncode = proc.wait()
+    
+    if returncode != 0:
+        raise RuntimeError(f"pigz exited with status {returncode}")
+
+class S3Upload(io.RawIOBase):
+    """
+    Writable stream that uploads to S3 as it is written (simulated).
+    
+    In a real implementation each write would feed a boto3 multipart upload,
+    so a backup streamed here never has to be staged on local disk.
+    """
+    
+    def __init__(self, s3_url: str):
+        """
+        Start an upload.
+        
+        Args:
+            s3_url: S3 URL for destination
+        """
+        super().__init__()
+        self.s3_url = s3_url
+        self.bytes_sent = 0
+        self._completed = False
+        
+        print(f"Simulating streaming upload to {s3_url}")
+        print("In a real implementation, this would use a boto3 multipart upload")
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, data) -> int:
+        size = len(data)
+        self.bytes_sent += size
+        return size
+    
+    def complete(self) -> None:
+        """Finish the upload once everything has been written."""
+        self._completed = True
+        print(f"Upload complete. {self.bytes_sent / (1024 * 1024):.2f} MB transferred to {self.s3_url}")
+    
+    def close(self) -> None:
+        if not self.closed and not self._completed:
+            print(f"Upload to {self.s3_url} aborted")
+        super().close()
+
+class _Tee(io.RawIOBase):
+    """Writable stream that copies everything written to it to several streams."""
+    
+    def __init__(self, *streams: BinaryIO):
+        super().__init__()
+        self._streams = streams
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, data) -> int:
+        for stream in self._streams:
+            stream.write(data)
+        return len(data)
 
 class BackupManager:
     def __init__(self, backup_dir: str):
@@ -30,7 +148,8 @@ class BackupManager:
     def create_backup(self, checkpoint_id: Optional[str] = None,
                      memory_dir: Optional[str] = None,
                      model_dir: Optional[str] = None,
-                     bolt_dir: Optional[str] = None) -> str:
+                     bolt_dir: Optional[str] = None,
+                     output_fileobj: Optional[BinaryIO] = None) -> str:
         """
         Create a backup of the specified directories or checkpoint.
         
@@ -39,7 +158,9 @@ class BackupManager:
             memory_dir: Directory containing memory atoms
             model_dir: Directory containing model checkpoints
             bolt_dir: Directory containing Bolt experiments
-            
+            output_fileobj: Stream to also write the backup to (e.g. an
+                S3Upload) as it is created in the backup directory
+        
         Returns:
             Path to the created backup file
         """
@@ -48,109 +169,93 @@ class BackupManager:
         backup_name = f"marduk-backup-{timestamp}.tar.gz"
         backup_path = os.path.join(self.backup_dir, backup_name)
         
-        # Create temporary directory for organizing files
-        with tempfile.TemporaryDirectory() as temp_dir:
-            try:
-                if checkpoint_id:
-                    # Backup from checkpoint
-                    checkpoint_dir = os.path.join("checkpoints", checkpoint_id)
-                    if not os.path.exists(checkpoint_dir):
-                        raise ValueError(f"Checkpoint not found: {checkpoint_id}")
-                    
-                    # Copy checkpoint to temp directory
-                    checkpoint_temp = os.path.join(temp_dir, "checkpoint")
-                    shutil.copytree(checkpoint_dir, checkpoint_temp)
-                    
-                    # Create metadata
-                    metadata = {
-                        "backup_type": "checkpoint",
-                        "checkpoint_id": checkpoint_id,
-                        "created_at": datetime.now().isoformat()
-                    }
-                    
-                    # Read checkpoint metadata if available
-                    checkpoint_meta_path = os.path.join(checkpoint_dir, "metadata.json")
-                    if os.path.exists(checkpoint_meta_path):
-                        with open(checkpoint_meta_path, 'r') as f:
-                            checkpoint_meta = json.load(f)
-                        metadata["checkpoint_metadata"] = checkpoint_meta
+        try:
+            if checkpoint_id:
+                # Backup from checkpoint
+                checkpoint_dir = os.path.join("checkpoints", checkpoint_id)
+                if not os.path.exists(checkpoint_dir):
+                    raise ValueError(f"Checkpoint not found: {checkpoint_id}")
                 
-                else:
-                    # Backup from directories
-                    dirs_to_backup = {}
-                    
-                    if memory_dir and os.path.exists(memory_dir):
-                        dirs_to_backup["memory"] = memory_dir
-                    
-                    if model_dir and os.path.exists(model_dir):
-                        dirs_to_backup["model"] = model_dir
-                    
-                    if bolt_dir and os.path.exists(bolt_dir):
-                        dirs_to_backup["bolt"] = bolt_dir
-                    
-                    if not dirs_to_backup:
-                        raise ValueError("No valid directories specified for backup")
-                    
-                    # Copy directories to temp
-                    for name, dir_path in dirs_to_backup.items():
-                        dest_path = os.path.join(temp_dir, name)
-                        shutil.copytree(dir_path, dest_path)
-                    
-                    # Create metadata
-                    metadata = {
-                        "backup_type": "directories",
-                        "directories": dirs_to_backup,
-                        "created_at": datetime.now().isoformat()
-                    }
+                sources = {"checkpoint": checkpoint_dir}
                 
-                # Write metadata
-                with open(os.path.join(temp_dir, "backup_metadata.json"), 'w') as f:
-                    json.dump(metadata, f, indent=2)
+                # Create metadata
+                metadata = {
+                    "backup_type": "checkpoint",
+                    "checkpoint_id": checkpoint_id,
+                    "created_at": datetime.now().isoformat()
+                }
+                
+                # Read checkpoint metadata if available
+                checkpoint_meta_path = os.path.join(checkpoint_dir, "metadata.json")
+                if os.path.exists(checkpoint_meta_path):
+                    with open(checkpoint_meta_path, 'rb') as f:
+                        checkpoint_meta = _loads(f.read())
+                    metadata["checkpoint_metadata"] = checkpoint_meta
+            
+            else:
+                # Backup from directories
+                dirs_to_backup = {}
+                
+                if memory_dir and os.path.exists(memory_dir):
+                    dirs_to_backup["memory"] = memory_dir
+                
+                if model_dir and os.path.exists(model_dir):
+                    dirs_to_backup["model"] = model_dir
                 
-                # Create the tarball
-                with tarfile.open(backup_path, "w:gz") as tar:
-                    tar.add(temp_dir, arcname=".")
+                if bolt_dir and os.path.exists(bolt_dir):
+                    dirs_to_backup["bolt"] = bolt_dir
                 
-                # Get size of backup
-                backup_size = os.path.getsize(backup_path)
-                backup_size_mb = backup_size / (1024 * 1024)
+                if not dirs_to_backup:
+                    raise ValueError("No valid directories specified for backup")
                 
-                print(f"Backup created: {backup_name}")
-                print(f"Path: {backup_path}")
-                print(f"Size: {backup_size_mb:.2f} MB")
+                sources = dirs_to_backup
                 
-                return backup_path
+                # Create metadata
+                metadata = {
+                    "backup_type": "directories",
+                    "directories": dirs_to_backup,
+                    "created_at": datetime.now().isoformat()
+                }
             
-            except Exception as e:
-                print(f"Error creating backup: {e}")
-                # Cleanup in case of error
-                if os.path.exists(backup_path):
-                    os.remove(backup_path)
-                raise
-    
-    def upload_to_s3(self, backup_path: str, s3_url: str) -> bool:
-        """
-        Upload a backup to S3 (simulated).
-        
-        Args:
-            backup_path: Path to backup file
-            s3_url: S3 URL for destination
+            # Create the tarball straight from the source directories, following
+            # symlinks so the backup holds file contents rather than links. A
+            # streamed backup is also written to the backup directory, which
+            # keeps the copy of record while the upload is only simulated
+            with contextlib.ExitStack() as stack:
+                if output_fileobj is not None:
+                    local_file = stack.enter_context(open(backup_path, 'wb'))
+                    tar_fileobj = _Tee(local_file, output_fileobj)
+                else:
+                    tar_fileobj = None
+                tar = stack.enter_context(_open_tarball(backup_path, tar_fileobj))
+                
+                # Write metadata
+                metadata_bytes = _dumps(metadata, pretty=True)
+                info = tarfile.TarInfo("./backup_metadata.json")
+                info.size = len(metadata_bytes)
+                info.mtime = int(time.time())
+                info.mode = 0o644
+                tar.addfile(info, io.BytesIO(metadata_bytes))
+                
+                for name, dir_path in sources.items():
+                    tar.add(dir_path, arcname=f"./{name}")
             
-        Returns:
-            True if successful
-        """
-        print(f"Simulating upload of {backup_path} to {s3_url}")
-        print("In a real implementation, this would use AWS CLI or boto3")
-        
-        # Simulate the upload with a delay
-        print("Uploading...")
-        
-        # Calculate file size
-        backup_size = os.path.getsize(backup_path)
-        backup_size_mb = backup_size / (1024 * 1024)
+            # Get sizeof backup
+            backup_size = os.path.getsize(backup_path)
+            backup_size_mb = backup_size / (1024 * 1024)
+            
+            print(f"Backup created: {backup_name}")
+            print(f"Path: {backup_path}")
+            print(f"Size: {backup_size_mb:.2f} MB")
+            
+            return backup_path
         
-        print(f"Upload complete. {backup_size_mb:.2f} MB transferred to {s3_url}")
-        return True
+        except Exception as e:
+            print(f"Error creating backup: {e}")
+            # Cleanup in case of error
+            if os.path.exists(backup_path):
+                os.remove(backup_path)
+            raise
     
     def list_backups(self) -> List[Dict[str, Any]]:
         """
@@ -161,28 +266,27 @@ class BackupManager:
         """
         backups = []
         
-        for item in os.listdir(self.backup_dir):
-            item_path = os.path.join(self.backup_dir, item)
-            
-            # Skip directories and non-tar.gz files
-            if not os.path.isfile(item_path) or not item.endswith('.tar.gz'):
-                continue
-            
-            # Get file stats
-            stats = os.stat(item_path)
-            size_mb = stats.st_size / (1024 * 1024)
-            created = datetime.fromtimestamp(stats.st_ctime).isoformat()
-            
-            # Extract metadata if possible (in a real implementation)
-            # Here we just create a simple entry
-            backup_info = {
-                "filename": item,
-                "path": item_path,
-                "size_mb": size_mb,
-                "created_at": created
-            }
-            
-            backups.append(backup_info)
+        with os.scandir(self.backup_dir) as it:
+            for entry in it:
+                # Skip directories and non-tar.gz files
+                if not entry.name.endswith('.tar.gz') or not entry.is_file():
+                    continue
+                
+                # Get file stats
+                stats = entry.stat()
+                size_mb = stats.st_size / (1024 * 1024)
+                created = datetime.fromtimestamp(stats.st_ctime).isoformat()
+                
+                # Extract metadata if possible (in a real implementation)
+                # Here we just create a simple entry
+                backup_info = {
+                    "filename": entry.name,
+                    "path": entry.path,
+                    "size_mb": size_mb,
+                    "created_at": created
+                }
+                
+                backups.append(backup_info)
         
         # Sort by creation time (newest first)
         backups.sort(key=lambda x: x.get('created_at', ''), reverse=True)
@@ -216,17 +320,22 @@ def main():
         try:
             # Create backup
             if args.checkpoint:
-                backup_path = backup_manager.create_backup(checkpoint_id=args.checkpoint)
+                backup_args = {"checkpoint_id": args.checkpoint}
             else:
-                backup_path = backup_manager.create_backup(
-                    memory_dir=args.memory_dir,
-                    model_dir=args.model_dir,
-                    bolt_dir=args.bolt_dir
-                )
+                backup_args = {
+                    "memory_dir": args.memory_dir,
+                    "model_dir": args.model_dir,
+                    "bolt_dir": args.bolt_dir
+                }
             
-            # Upload if destination specified
-            if args.destination and backup_path:
-                backup_manager.upload_to_s3(backup_path, args.destination)
+            if args.destination:
+                # Stream to the destination as the local backup is written,
+                # rather than reading the finished tarball back to upload it
+                with S3Upload(args.destination) as upload:
+                    backup_manager.create_backup(output_fileobj=upload, **backup_args)
+                    upload.complete()
+            else:
+                backup_manager.create_backup(**backup_args)
         
         except Exception as e:
             print(f"Error: {e}")
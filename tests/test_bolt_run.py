@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for the Bolt experiment runner's per-operation circuit breaker.
+"""
+
+import importlib
+import logging
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "bolt"))
+
+# Importing the runner opens bolt.log in the working directory, so import it
+# from a temporary one
+run = None
+_tmp = None
+_cwd = None
+
+def setUpModule():
+    global run, _tmp, _cwd
+    _tmp = tempfile.TemporaryDirectory()
+    _cwd = os.getcwd()
+    os.chdir(_tmp.name)
+    run = importlib.import_module("run")
+    run.logger.setLevel(logging.ERROR)
+
+def tearDownModule():
+    os.chdir(_cwd)
+    _tmp.cleanup()
+
+class CircuitBreakerTest(unittest.TestCase):
+    def setUp(self):
+        config_path = os.path.join(_tmp.name, "experiment.toml")
+        with open(config_path, "w") as f:
+            f.write('name = "Breaker test"\n')
+        self.experiment = run.BoltExperiment(config_path)
+        self.experiment._breaker_threshold = 3
+        self.experiment._breaker_cooldown = 0.05
+        
+        self.calls = 0
+        self.fail = True
+        self.experiment._op_handlers["search"] = self._handler
+    
+    def _handler(self, step, op_config, idempotency_key):
+        self.calls += 1
+        if self.fail:
+            raise OSError("search backend unavailable")
+        return {"status": "success"}
+    
+    def _execute(self):
+        return self.experiment._execute_operation({"op": "search"}, timeout=1)
+    
+    def _fail_until_open(self):
+        for _ in range(self.experiment._breaker_threshold):
+            with self.assertRaises(OSError):
+                self._execute()
+    
+    def test_breaker_opens_after_threshold_failures(self):
+        self._fail_until_open()
+        
+        with self.assertRaises(run.CircuitOpenError):
+            self._execute()
+        # An open breaker doesn't call the operation at all
+        self.assertEqual(self.calls, self.experiment._breaker_threshold)
+    
+    def test_breaker_closes_after_cooldown_and_success(self):
+        self._fail_until_open()
+        time.sleep(self.experiment._breaker_cooldown * 2)
+        
+        self.fail = False
+        self.assertEqual(self._execute()["status"], "success")
+        self.assertNotIn("search", self.experiment._breaker)
+        
+        # The failure count starts again from zero
+        self.fail = True
+        with self.assertRaises(OSError):
+            self._execute()
+        self.fail = False
+        self.assertEqual(self._execute()["status"], "success")
+    
+    def test_success_resets_failure_count(self):
+        for _ in range(self.experiment._breaker_threshold - 1):
+            with self.assertRaises(OSError):
+                self._execute()
+        self.fail = False
+        self._execute()
+        
+        self.fail = True
+        for _ in range(self.experiment._breaker_threshold - 1):
+            with self.assertRaises(OSError):
+                self._execute()
+        self.fail = False
+        self.assertEqual(self._execute()["status"], "success")
+
+if __name__ == "__main__":
+    unittest.main()
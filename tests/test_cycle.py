@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for the toroidal cycle event log and state transitions.
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "governance"))
+
+from cycle import ToroidalCycle
+
+class ToroidalCycleTest(unittest.TestCase):
+    def setUp(self):
+        # The cycle manager keeps explorations under the working directory
+        self._tmp = tempfile.TemporaryDirectory()
+        self._cwd = os.getcwd()
+        os.chdir(self._tmp.name)
+        
+        with open("policy.yaml", "w") as f:
+            f.write("lightface:\n  topic: testing\n  duration: 1\n")
+        self.cycle = ToroidalCycle("policy.yaml", output_dir="cycles")
+        
+        # Keep the progress messages out of the test output
+        self._quiet = contextlib.redirect_stdout(io.StringIO())
+        self._quiet.__enter__()
+    
+    def tearDown(self):
+        self._quiet.__exit__(None, None, None)
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+    
+    def test_replay_ignores_torn_last_line(self):
+        cycle_id = self.cycle.start_cycle("Torn log")["id"]
+        self.cycle.execute_lightface_phase(cycle_id)
+        
+        # Simulate an append interrupted partway through an event
+        _, log_file = self.cycle._cycle_paths(cycle_id)
+        with open(log_file, "ab") as f:
+            f.write(b'{"event":"phase_completed","index":0,"pha')
+        
+        cycle = self.cycle._load_cycle(cycle_id)
+        self.assertEqual(cycle["current_phase"], "lightface")
+        self.assertEqual(len(cycle["phases"]), 1)
+        self.assertEqual(cycle["phases"][0]["status"], "active")
+        
+        # The next append replaces the torn line rather than following it
+        self.cycle.complete_phase(cycle_id)
+        cycle = self.cycle._load_cycle(cycle_id)
+        self.assertEqual(cycle["current_phase"], "complete")
+        self.assertEqual(cycle["phases"][0]["status"], "completed")
+    
+    def test_complete_cycle_writes_snapshot_and_removes_log(self):
+        cycle_id = self.cycle.start_cycle("Snapshot")["id"]
+        self.cycle.execute_lightface_phase(cycle_id)
+        _, log_file = self.cycle._cycle_paths(cycle_id)
+        self.assertTrue(os.path.exists(log_file))
+        
+        self.cycle.complete_cycle(cycle_id, summary="done")
+        self.assertFalse(os.path.exists(log_file))
+        
+        cycle = self.cycle._load_cycle(cycle_id)
+        self.assertEqual(cycle["status"], "completed")
+        self.assertEqual(cycle["phases"][0]["status"], "completed")
+    
+    def test_complete_phase_without_active_phase_is_rejected(self):
+        cycle_id = self.cycle.start_cycle("No phase")["id"]
+        with self.assertRaisesRegex(ValueError, "No active phase"):
+            self.cycle.complete_phase(cycle_id)
+        
+        self.cycle.execute_lightface_phase(cycle_id)
+        self.cycle.complete_phase(cycle_id)
+        with self.assertRaisesRegex(ValueError, "No active phase"):
+            self.cycle.complete_phase(cycle_id)
+    
+    def test_completed_cycle_rejects_further_actions(self):
+        cycle_id = self.cycle.start_cycle("Closed")["id"]
+        self.cycle.complete_cycle(cycle_id, summary="done")
+        
+        with self.assertRaisesRegex(ValueError, "not active"):
+            self.cycle.execute_lightface_phase(cycle_id)
+        with self.assertRaisesRegex(ValueError, "not active"):
+            self.cycle.complete_phase(cycle_id)
+        with self.assertRaisesRegex(ValueError, "not active"):
+            self.cycle.complete_cycle(cycle_id)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tests for the LightFace exploration index.
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "governance"))
+
+from lightface import LightFaceExploration
+
+class ExplorationIndexTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.explorer = LightFaceExploration(self._tmp.name)
+        
+        # Keep the progress messages out of the test output
+        self._quiet = contextlib.redirect_stdout(io.StringIO())
+        self._quiet.__enter__()
+    
+    def tearDown(self):
+        self._quiet.__exit__(None, None, None)
+        self._tmp.cleanup()
+    
+    def _index_lines(self):
+        with open(self.explorer._index_file, "rb") as f:
+            return f.read().splitlines()
+    
+    def test_list_compacts_superseded_index_lines(self):
+        session_id = self.explorer.start_exploration("compaction")["id"]
+        for i in range(4):
+            self.explorer.add_exploration_node(session_id, f"Node {i}", "content", ["tag"])
+        
+        # One line for the new session and one per saved node
+        self.assertEqual(len(self._index_lines()), 5)
+        
+        sessions = self.explorer.list_explorations()
+        self.assertEqual(len(self._index_lines()), 1)
+        self.assertEqual(len(sessions), 1)
+        self.assertEqual(sessions[0]["id"], session_id)
+        self.assertEqual(sessions[0]["node_count"], 4)
+    
+    def test_list_drops_sessions_whose_files_are_gone(self):
+        session_id = self.explorer.start_exploration("removed")["id"]
+        os.remove(self.explorer._session_file(session_id))
+        
+        self.assertEqual(self.explorer.list_explorations(), [])
+        self.assertEqual(self._index_lines(), [])
+    
+    def test_list_full_returns_whole_sessions(self):
+        session_id = self.explorer.start_exploration("full")["id"]
+        self.explorer.add_exploration_node(session_id, "Node", "content", ["tag"])
+        
+        sessions = self.explorer.list_explorations(full=True)
+        self.assertEqual(len(sessions), 1)
+        self.assertEqual(len(sessions[0]["nodes"]), 1)
+        self.assertIn("branches", sessions[0])
+
+if __name__ == "__main__":
+    unittest.main()